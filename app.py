@@ -1,17 +1,31 @@
+import copy
+import importlib
+
 import streamlit as st
 
-from modules.classifier import render_classifier
-from modules.value_mapper import render_value_mapper
-from modules.pricing_rec import render_pricing_rec
-from modules.health_check import render_health_check
-from modules.unit_cost_calc import render_unit_cost_calc
-from modules.gross_margin_calc import render_gross_margin_calc
-
-st.set_page_config(
-    page_title="AI Pricing Navigator",
-    page_icon="\U0001f4b0",
-    layout="wide",
+from data.app_text import (
+    ABOUT_MD,
+    APP_CAPTION,
+    APP_ICON,
+    APP_NAME,
+    APP_TITLE,
+    FOOTER_CAPTION,
+    FOOTER_MD,
+    MAIN_FOOTER_MD,
+    PLAYBOOK_LINK_MD,
+    WELCOME_CARDS_HTML,
 )
+from data.session import SESSION_DEFAULTS
+from utils.navigation import rerun_if_navigated
+
+# The frontend keeps page config across reruns, so send it once per session
+if not st.session_state.get("_page_configured"):
+    st.set_page_config(
+        page_title=APP_NAME,
+        page_icon=APP_ICON,
+        layout="wide",
+    )
+    st.session_state["_page_configured"] = True
 
 # ---------------------------------------------------------------------------
 # Global font size overrides
@@ -31,27 +45,10 @@ st.markdown(
 # ---------------------------------------------------------------------------
 # Session state defaults
 # ---------------------------------------------------------------------------
-_defaults = {
-    "classifier_answers": {},
-    "business_model": "",
-    "model_confidence": 0.0,
-    "value_answers": {},
-    "x_score": 0.0,
-    "y_score": 0.0,
-    "quadrant": "",
-    "pricing_answers": {},
-    "recommended_model": "",
-    "pricing_recommendation": {},
-    "pricing_formula": {},
-    "health_scores": {},
-    "health_label": "",
-    "overall_score": 0.0,
-    "priority_areas": [],
-    "confirm_reset": False,
-}
-for _k, _v in _defaults.items():
-    if _k not in st.session_state:
-        st.session_state[_k] = _v
+if not st.session_state.get("_initialized"):
+    for _k, _v in SESSION_DEFAULTS.items():
+        st.session_state.setdefault(_k, copy.copy(_v))
+    st.session_state["_initialized"] = True
 
 _NAV_OPTIONS = [
     "\U0001f3e0 Welcome",
@@ -63,11 +60,33 @@ _NAV_OPTIONS = [
 ]
 
 # ---------------------------------------------------------------------------
-# Sidebar - navigation
+# Sidebar - reset flow
+# ---------------------------------------------------------------------------
+@st.fragment
+def _render_reset():
+    """Start Over / confirm buttons. Only a confirmed reset reruns the app."""
+    if st.button("\U0001f504 Start Over"):
+        st.session_state.confirm_reset = True
+
+    if st.session_state.confirm_reset:
+        st.warning("This will clear all your answers.")
+        c1, c2 = st.columns(2)
+        if c1.button("Yes, reset"):
+            st.session_state.clear()
+            st.rerun()
+
+        def _cancel_reset():
+            st.session_state.confirm_reset = False
+
+        c2.button("Cancel", on_click=_cancel_reset)
+
+
+# ---------------------------------------------------------------------------
+# Sidebar - navigation, reset, about + footer
 # ---------------------------------------------------------------------------
 with st.sidebar:
-    st.header("\U0001f4b0 AI Pricing Navigator")
-    st.caption("Design your AI pricing strategy in minutes")
+    st.header(APP_TITLE)
+    st.caption(APP_CAPTION)
     st.divider()
 
     module = st.radio(
@@ -79,51 +98,25 @@ with st.sidebar:
 
     st.divider()
 
-    # Reset button
-    if st.button("\U0001f504 Start Over"):
-        st.session_state.confirm_reset = True
-
-    if st.session_state.confirm_reset:
-        st.warning("This will clear all your answers.")
-        c1, c2 = st.columns(2)
-        if c1.button("Yes, reset"):
-            keys = [k for k in st.session_state.keys()]
-            for k in keys:
-                del st.session_state[k]
-            st.rerun()
-        if c2.button("Cancel"):
-            st.session_state.confirm_reset = False
-            st.rerun()
+    _render_reset()
 
     st.divider()
 
-# Sidebar - about + footer
-with st.sidebar:
+    # About + footer
     with st.expander("About this tool"):
-        st.markdown(
-            "AI Pricing Navigator helps AI founders design their pricing "
-            "strategy using frameworks from Bessemer Venture Partners\u2019 "
-            "AI Pricing Playbook. Answer questions about your business and "
-            "get a tailored pricing model recommendation."
-        )
+        st.markdown(ABOUT_MD)
         st.markdown("This tool is free and does not store any data.")
-        st.markdown(
-            "[Read the full BVP playbook \u2192]"
-            "(https://www.bvp.com/atlas/the-ai-pricing-and-monetization-playbook)"
-        )
-
-    st.markdown("[Built by K-Space](https://kspacegrowth.com/)")
-    st.caption(
-        "Framework based on Bessemer Venture Partners\u2019 "
-        "AI Pricing Playbook (2026)"
-    )
+        st.markdown(PLAYBOOK_LINK_MD)
+
+    st.markdown(FOOTER_MD)
+    st.caption(FOOTER_CAPTION)
 
 
 # ---------------------------------------------------------------------------
 # Welcome page
 # ---------------------------------------------------------------------------
 def _render_welcome():
-    st.title("AI Pricing Navigator")
+    st.title(APP_NAME)
     st.markdown("### Design your AI pricing strategy in minutes.")
     st.markdown(
         "This tool walks you through a 3-step process to help you choose the "
@@ -132,19 +125,7 @@ def _render_welcome():
         "with real numbers."
     )
 
-    c1, c2, c3 = st.columns(3)
-    with c1:
-        with st.container(border=True):
-            st.markdown("\U0001f50d **Step 1: Classify**")
-            st.caption("What type of AI business are you?")
-    with c2:
-        with st.container(border=True):
-            st.markdown("\U0001f4ca **Step 2: Map Value**")
-            st.caption("Where\u2019s your pricing power?")
-    with c3:
-        with st.container(border=True):
-            st.markdown("\U0001f4b0 **Step 3: Get Your Model**")
-            st.caption("Concrete pricing formula")
+    st.markdown(WELCOME_CARDS_HTML, unsafe_allow_html=True)
 
     st.markdown(
         "**Plus:** Take the Pricing Health Check - a standalone self-assessment "
@@ -161,37 +142,59 @@ def _render_welcome():
 # Tools page
 # ---------------------------------------------------------------------------
 def _render_tools():
+    from modules.unit_cost_calc import render_unit_cost_calc
+    from modules.gross_margin_calc import render_gross_margin_calc
+
     st.title("Tools")
     st.markdown("Calculators to help you nail your pricing numbers.")
     tab1, tab2 = st.tabs(["Unit Cost Calculator", "Gross Margin Calculator"])
     with tab1:
-        render_unit_cost_calc()
+        _render_tool(render_unit_cost_calc)
     with tab2:
-        render_gross_margin_calc()
+        _render_tool(render_gross_margin_calc)
+
+
+@st.fragment
+def _render_tool(render_fn):
+    """Run one calculator as its own fragment so the other tab stays put."""
+    rerun_if_navigated("\U0001f9ee Tools")
+    render_fn()
 
 
 # ---------------------------------------------------------------------------
 # Module routing
 # ---------------------------------------------------------------------------
-if module == "\U0001f3e0 Welcome":
-    _render_welcome()
-elif module == "1. Classify Business":
-    render_classifier()
-elif module == "2. Map Value":
-    render_value_mapper()
-elif module == "3. Pricing Model":
-    render_pricing_rec()
-elif module == "4. Health Check":
-    render_health_check()
-elif module == "\U0001f9ee Tools":
-    _render_tools()
+# Step pages are (module, function) pairs imported on demand so a rerun only
+# loads the page being shown (and its pandas/plotly dependencies).
+_ROUTES = {
+    "\U0001f3e0 Welcome": _render_welcome,
+    "1. Classify Business": ("modules.classifier", "render_classifier"),
+    "2. Map Value": ("modules.value_mapper", "render_value_mapper"),
+    "3. Pricing Model": ("modules.pricing_rec", "render_pricing_rec"),
+    "4. Health Check": ("modules.health_check", "render_health_check"),
+    "\U0001f9ee Tools": _render_tools,
+}
+
+
+def _resolve_route(route):
+    if callable(route):
+        return route
+    mod_path, fn_name = route
+    return getattr(importlib.import_module(mod_path), fn_name)
+
+
+@st.fragment
+def _render_page(page):
+    """Render one page as a fragment so its widgets don't rerun the sidebar."""
+    rerun_if_navigated(page)
+    _resolve_route(_ROUTES[page])()
+
+
+_render_page(module)
 
 # ---------------------------------------------------------------------------
 # Main area footer
 # ---------------------------------------------------------------------------
 st.divider()
-st.markdown("[Built by K-Space](https://kspacegrowth.com/) | AI-powered business development tools")
-st.caption(
-    "Framework based on Bessemer Venture Partners\u2019 "
-    "AI Pricing Playbook (2026)"
-)
+st.markdown(MAIN_FOOTER_MD)
+st.caption(FOOTER_CAPTION)
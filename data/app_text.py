@@ -0,0 +1,51 @@
+"""Static app copy shared by the entrypoint and modules."""
+
+APP_NAME = "AI Pricing Navigator"
+APP_ICON = "\U0001f4b0"
+APP_TITLE = f"{APP_ICON} {APP_NAME}"
+APP_CAPTION = "Design your AI pricing strategy in minutes"
+
+# ---------------------------------------------------------------------------
+# Sidebar - about + footer
+# ---------------------------------------------------------------------------
+ABOUT_MD = (
+    "AI Pricing Navigator helps AI founders design their pricing "
+    "strategy using frameworks from Bessemer Venture Partners\u2019 "
+    "AI Pricing Playbook. Answer questions about your business and "
+    "get a tailored pricing model recommendation."
+)
+PLAYBOOK_LINK_MD = (
+    "[Read the full BVP playbook \u2192]"
+    "(https://www.bvp.com/atlas/the-ai-pricing-and-monetization-playbook)"
+)
+FOOTER_MD = "[Built by K-Space](https://kspacegrowth.com/)"
+MAIN_FOOTER_MD = f"{FOOTER_MD} | AI-powered business development tools"
+FOOTER_CAPTION = (
+    "Framework based on Bessemer Venture Partners\u2019 "
+    "AI Pricing Playbook (2026)"
+)
+
+# ---------------------------------------------------------------------------
+# Welcome page - the three step cards as one HTML element
+# ---------------------------------------------------------------------------
+_WELCOME_CARD = (
+    "<div style='flex:1;border:1px solid rgba(128,128,128,0.3);"
+    "border-radius:0.5rem;padding:1rem'>"
+    "{title}<br><small style='opacity:0.6'>{caption}</small></div>"
+)
+WELCOME_CARDS_HTML = (
+    "<div style='display:flex;gap:1rem;margin-bottom:1rem'>"
+    + _WELCOME_CARD.format(
+        title="\U0001f50d <b>Step 1: Classify</b>",
+        caption="What type of AI business are you?",
+    )
+    + _WELCOME_CARD.format(
+        title="\U0001f4ca <b>Step 2: Map Value</b>",
+        caption="Where\u2019s your pricing power?",
+    )
+    + _WELCOME_CARD.format(
+        title="\U0001f4b0 <b>Step 3: Get Your Model</b>",
+        caption="Concrete pricing formula",
+    )
+    + "</div>"
+)
@@ -1,5 +1,7 @@
 """Comparable company pricing examples."""
 
+import pandas as pd
+
 COMP_TABLE = [
     {
         "name": "DeepL",
@@ -67,6 +69,19 @@ COMP_TABLE = [
 ]
 
 
+# Index by model type, built once at import
+_BY_MODEL = {}
+for _c in COMP_TABLE:
+    _BY_MODEL.setdefault(_c["model_type"], []).append(_c)
+
+# Display frames for st.dataframe, built once from the same index
+_DF_BY_MODEL = {}
+for _model, _rows in _BY_MODEL.items():
+    _df = pd.DataFrame(_rows).drop(columns=["model_type"])
+    _df.columns = ["Company", "Pricing Model", "Detail", "Value Driver"]
+    _DF_BY_MODEL[_model] = _df
+
+
 def get_comps_by_model(model_type):
     """Return comp table entries matching the given model type.
 
@@ -74,6 +89,20 @@ def get_comps_by_model(model_type):
         model_type: "Copilot", "Agent", or "AI-enabled Service"
 
     Returns:
-        List of matching company dicts.
+        List of matching company dicts. The list is shared - don't mutate it.
+    """
+    return _BY_MODEL.get(model_type, [])
+
+
+def get_comps_df(model_type):
+    """Return comp table entries for a model type as a display DataFrame.
+
+    Args:
+        model_type: "Copilot", "Agent", or "AI-enabled Service"
+
+    Returns:
+        DataFrame with Company, Pricing Model, Detail and Value Driver
+        columns, or None if no company matches. The frame is shared -
+        don't mutate it.
     """
-    return [c for c in COMP_TABLE if c["model_type"] == model_type]
+    return _DF_BY_MODEL.get(model_type)
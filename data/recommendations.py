@@ -1,6 +1,26 @@
 """Recommendation data: business models, quadrants, pricing logic, health check actions."""
 
-BUSINESS_MODELS = {
+import sys
+from types import MappingProxyType
+
+
+def _interned(obj):
+    """Return obj with every string leaf passed through sys.intern."""
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, tuple):
+        return tuple(_interned(v) for v in obj)
+    if isinstance(obj, dict):
+        return {k: _interned(v) for k, v in obj.items()}
+    return obj
+
+
+def _frozen(d):
+    """Interned, read-only view of a static dict."""
+    return MappingProxyType(_interned(d))
+
+
+BUSINESS_MODELS = _interned({
     "Copilot": {
         "description": (
             "Your AI works alongside a human user in real-time, augmenting their "
@@ -8,11 +28,11 @@ BUSINESS_MODELS = {
             "seat while your AI suggests, drafts, and recommends. Value scales with "
             "how many people adopt the tool across an organization."
         ),
-        "examples": [
+        "examples": (
             "GitHub Copilot - AI pair programmer that suggests code in-editor",
             "Grammarly - AI writing assistant that improves text as you type",
             "Notion AI - drafts, summarizes, and edits within the user's workflow",
-        ],
+        ),
         "pricing_implications": (
             "Per-seat pricing works well because value is tied to individual users. "
             "Consider feature tiers to capture different willingness-to-pay across segments."
@@ -25,11 +45,11 @@ BUSINESS_MODELS = {
             "goal and the AI executes, sometimes with a human review step. Value is "
             "measured in outcomes delivered, not time spent using the product."
         ),
-        "examples": [
+        "examples": (
             "Intercom Fin - AI agent that resolves customer support tickets autonomously",
             "Devin - AI software engineer that completes coding tasks end-to-end",
             "Resolve AI - autonomous incident response and uptime management",
-        ],
+        ),
         "pricing_implications": (
             "Outcome-based or per-task pricing aligns cost with value delivered. "
             "Customers pay for results, not access, which de-risks the purchase decision."
@@ -42,19 +62,19 @@ BUSINESS_MODELS = {
             "There may be a human QA layer, but the AI does the heavy lifting. "
             "Customers evaluate you against the cost of the service you replace."
         ),
-        "examples": [
+        "examples": (
             "EvenUp - AI-generated legal demand packages replacing paralegal work",
             "Pepper Content - AI content creation replacing freelance writers",
             "Jasper - AI marketing content replacing agency copywriting",
-        ],
+        ),
         "pricing_implications": (
             "Price anchored to the cost of the service you replace, typically at a "
             "discount. Per-deliverable pricing makes the value proposition concrete."
         ),
     },
-}
+})
 
-QUADRANTS = {
+QUADRANTS = _interned({
     "Revenue Engine": {
         "label": "Revenue Engine",
         "description": (
@@ -104,6 +124,108 @@ QUADRANTS = {
         ),
         "renewal_risk": True,
     },
+})
+
+
+# ---------------------------------------------------------------------------
+# Pricing recommendations
+# ---------------------------------------------------------------------------
+# Each recommendation is a shared read-only mapping; the lookup table below
+# maps every (business_model, hard_roi, cost_variance) combination to one.
+
+_PER_SEAT_TIERS = _frozen({
+    "model_name": "Per-seat + Feature Tiers",
+    "rationale": (
+        "Your copilot delivers measurable value with predictable costs. "
+        "Per-seat pricing captures value as adoption grows, while feature "
+        "tiers let you segment by willingness-to-pay."
+    ),
+    "formula_type": "per_seat",
+})
+
+_HYBRID_USAGE = _frozen({
+    "model_name": "Hybrid (Base + Usage Tiers)",
+    "rationale": (
+        "A platform fee provides revenue predictability while usage-based "
+        "tiers align your revenue with the value users extract. This "
+        "protects margins when costs are variable or ROI is soft."
+    ),
+    "formula_type": "hybrid",
+})
+
+_OUTCOME = _frozen({
+    "model_name": "Outcome-based",
+    "rationale": (
+        "Your agent delivers measurable results with manageable cost "
+        "variance. Charging per outcome aligns your price directly with "
+        "the value customers receive, making the ROI self-evident."
+    ),
+    "formula_type": "outcome",
+})
+
+_HYBRID_OUTCOME = _frozen({
+    "model_name": "Hybrid (Base + Outcome Credits)",
+    "rationale": (
+        "Your agent delivers hard ROI but high cost variance means pure "
+        "outcome pricing risks margin erosion. A base fee covers fixed "
+        "costs while outcome credits capture upside."
+    ),
+    "formula_type": "hybrid",
+})
+
+_WORKFLOW_TASK = _frozen({
+    "model_name": "Workflow-based (Per Task)",
+    "rationale": (
+        "With soft ROI, charging per task completed makes the price "
+        "concrete and predictable for buyers. It also naturally caps "
+        "your cost exposure per unit of revenue."
+    ),
+    "formula_type": "workflow",
+})
+
+_OUTCOME_DELIVERABLE = _frozen({
+    "model_name": "Outcome-based (Per Deliverable)",
+    "rationale": (
+        "Your service delivers measurable results that replace existing "
+        "spend. Per-deliverable pricing anchors to the service you replace "
+        "and makes ROI calculation trivial for the buyer."
+    ),
+    "formula_type": "outcome",
+})
+
+_WORKFLOW_SLA = _frozen({
+    "model_name": "Workflow-based + SLA Tiers",
+    "rationale": (
+        "With soft ROI, workflow-based pricing keeps the unit economics "
+        "clear while SLA tiers (turnaround time, quality guarantees) let "
+        "you capture willingness-to-pay from premium customers."
+    ),
+    "formula_type": "workflow",
+})
+
+# Quadrants where customers can measure ROI directly
+_HARD_ROI = frozenset({"Revenue Engine", "Efficiency Machine"})
+
+# (business_model, hard_roi, cost_variance) -> recommendation
+_REC_TABLE = {
+    ("Copilot", True, "low"): _PER_SEAT_TIERS,
+    ("Copilot", True, "moderate"): _HYBRID_USAGE,
+    ("Copilot", True, "high"): _HYBRID_USAGE,
+    ("Copilot", False, "low"): _HYBRID_USAGE,
+    ("Copilot", False, "moderate"): _HYBRID_USAGE,
+    ("Copilot", False, "high"): _HYBRID_USAGE,
+    ("Agent", True, "low"): _OUTCOME,
+    ("Agent", True, "moderate"): _OUTCOME,
+    ("Agent", True, "high"): _HYBRID_OUTCOME,
+    ("Agent", False, "low"): _WORKFLOW_TASK,
+    ("Agent", False, "moderate"): _WORKFLOW_TASK,
+    ("Agent", False, "high"): _WORKFLOW_TASK,
+    ("AI-enabled Service", True, "low"): _OUTCOME_DELIVERABLE,
+    ("AI-enabled Service", True, "moderate"): _OUTCOME_DELIVERABLE,
+    ("AI-enabled Service", True, "high"): _OUTCOME_DELIVERABLE,
+    ("AI-enabled Service", False, "low"): _WORKFLOW_SLA,
+    ("AI-enabled Service", False, "moderate"): _WORKFLOW_SLA,
+    ("AI-enabled Service", False, "high"): _WORKFLOW_SLA,
 }
 
 
@@ -116,136 +238,82 @@ def get_pricing_recommendation(business_model, quadrant, cost_variance):
         cost_variance: "low", "moderate", or "high"
 
     Returns:
-        dict with model_name, rationale, formula_type
+        Read-only mapping with model_name, rationale, formula_type
     """
-    hard_roi = quadrant in ("Revenue Engine", "Efficiency Machine")
-
-    if business_model == "Copilot":
-        if hard_roi and cost_variance == "low":
-            return {
-                "model_name": "Per-seat + Feature Tiers",
-                "rationale": (
-                    "Your copilot delivers measurable value with predictable costs. "
-                    "Per-seat pricing captures value as adoption grows, while feature "
-                    "tiers let you segment by willingness-to-pay."
-                ),
-                "formula_type": "per_seat",
-            }
-        else:
-            return {
-                "model_name": "Hybrid (Base + Usage Tiers)",
-                "rationale": (
-                    "A platform fee provides revenue predictability while usage-based "
-                    "tiers align your revenue with the value users extract. This "
-                    "protects margins when costs are variable or ROI is soft."
-                ),
-                "formula_type": "hybrid",
-            }
-
-    elif business_model == "Agent":
-        if hard_roi and cost_variance in ("low", "moderate"):
-            return {
-                "model_name": "Outcome-based",
-                "rationale": (
-                    "Your agent delivers measurable results with manageable cost "
-                    "variance. Charging per outcome aligns your price directly with "
-                    "the value customers receive, making the ROI self-evident."
-                ),
-                "formula_type": "outcome",
-            }
-        elif hard_roi and cost_variance == "high":
-            return {
-                "model_name": "Hybrid (Base + Outcome Credits)",
-                "rationale": (
-                    "Your agent delivers hard ROI but high cost variance means pure "
-                    "outcome pricing risks margin erosion. A base fee covers fixed "
-                    "costs while outcome credits capture upside."
-                ),
-                "formula_type": "hybrid",
-            }
-        else:
-            return {
-                "model_name": "Workflow-based (Per Task)",
-                "rationale": (
-                    "With soft ROI, charging per task completed makes the price "
-                    "concrete and predictable for buyers. It also naturally caps "
-                    "your cost exposure per unit of revenue."
-                ),
-                "formula_type": "workflow",
-            }
-
-    else:  # AI-enabled Service
-        if hard_roi:
-            return {
-                "model_name": "Outcome-based (Per Deliverable)",
-                "rationale": (
-                    "Your service delivers measurable results that replace existing "
-                    "spend. Per-deliverable pricing anchors to the service you replace "
-                    "and makes ROI calculation trivial for the buyer."
-                ),
-                "formula_type": "outcome",
-            }
-        else:
-            return {
-                "model_name": "Workflow-based + SLA Tiers",
-                "rationale": (
-                    "With soft ROI, workflow-based pricing keeps the unit economics "
-                    "clear while SLA tiers (turnaround time, quality guarantees) let "
-                    "you capture willingness-to-pay from premium customers."
-                ),
-                "formula_type": "workflow",
-            }
+    hard_roi = quadrant in _HARD_ROI
 
+    if business_model not in ("Copilot", "Agent"):
+        business_model = "AI-enabled Service"
 
-HEALTH_CHECK_ACTIONS = {
-    "m4_q1": (
+    rec = _REC_TABLE.get((business_model, hard_roi, cost_variance))
+    if rec is None:
+        # Unknown cost variance: Copilot and Agent fall back to their
+        # soft-ROI recommendation, AI-enabled Service ignores variance
+        service_hard_roi = hard_roi and business_model == "AI-enabled Service"
+        rec = _REC_TABLE[(business_model, service_hard_roi, "moderate")]
+    return rec
+
+
+# Priority actions for Module 4, in question order (m4_q1 .. m4_q10)
+_HEALTH_ACTIONS = _interned((
+    (
         "Study the key differences between AI and SaaS unit economics. AI companies "
         "typically have 50-60% gross margins vs 80-90% for SaaS. Factor in inference "
         "costs, model training, and data processing when calculating your true margins."
     ),
-    "m4_q2": (
+    (
         "Map your product's delivery model (copilot, agent, or service) to the pricing "
         "models that align with customer expectations. Misalignment between how value "
         "is delivered and how you charge is the #1 cause of pricing friction."
     ),
-    "m4_q3": (
+    (
         "Simplify your pricing page to pass the '5-second test' - can a first-time "
         "visitor understand what they'll pay? Consider removing usage dimensions that "
         "require explanation and anchoring on a metric your buyer already tracks."
     ),
-    "m4_q4": (
+    (
         "Build a cost monitoring dashboard tracking per-customer inference costs. Set "
         "up alerts for cost spikes and consider implementing usage caps, prompt caching, "
         "or model cascading to reduce cost variance."
     ),
-    "m4_q5": (
+    (
         "Define specific activation signals (e.g., 3+ high-value outputs, team sharing, "
         "integration setup) that indicate a user has experienced enough value to convert. "
         "Time-based trials often underperform value-based triggers for AI products."
     ),
-    "m4_q6": (
+    (
         "Start tracking AI-specific metrics: cost per AI interaction, AI resolution rate, "
         "value delivered per dollar of inference cost, and output quality scores. These "
         "supplement but don't replace traditional SaaS metrics like NRR and CAC."
     ),
-    "m4_q7": (
+    (
         "Build a unit economics model that includes all hidden costs: inference API calls, "
         "fine-tuning, human review/QA time, data storage, and retraining cycles. Many AI "
         "companies underestimate true costs by 30-50%."
     ),
-    "m4_q8": (
+    (
         "If you and competitors use similar foundation models, your pricing differentiation "
         "must come from proprietary data, fine-tuning, workflow integration, or domain "
         "expertise - not the AI itself. Price the outcome, not the model."
     ),
-    "m4_q9": (
+    (
         "Stress-test your pricing against 3 scenarios: inference costs increase 2x, "
         "customer usage doubles, and a competitor offers a free tier. If your pricing "
         "breaks under any scenario, you have a sustainability gap to address."
     ),
-    "m4_q10": (
+    (
         "Audit your pricing for scalability friction: custom quotes, manual provisioning, "
         "complex metering, or per-customer pricing exceptions. Each adds operational "
         "overhead that compounds. Design for self-serve where possible."
     ),
+))
+
+# Keyed by question ID for callers that look actions up by "m4_qN"
+HEALTH_CHECK_ACTIONS = {
+    f"m4_q{i}": action for i, action in enumerate(_HEALTH_ACTIONS, start=1)
 }
+
+
+def get_health_action(i):
+    """Return the priority action for Module 4 question number i (1-10)."""
+    return _HEALTH_ACTIONS[i - 1]
@@ -0,0 +1,24 @@
+"""Session state defaults shared by all modules."""
+
+from types import MappingProxyType
+
+# Seeded into st.session_state on the first run of each session. Mutable
+# values are copied on seeding so sessions never share the same object.
+SESSION_DEFAULTS = MappingProxyType({
+    "classifier_answers": {},
+    "business_model": "",
+    "model_confidence": 0.0,
+    "value_answers": {},
+    "x_score": 0.0,
+    "y_score": 0.0,
+    "quadrant": "",
+    "pricing_answers": {},
+    "recommended_model": "",
+    "pricing_recommendation": {},
+    "pricing_formula": None,
+    "health_scores": {},
+    "health_label": "",
+    "overall_score": 0.0,
+    "priority_areas": [],
+    "confirm_reset": False,
+})
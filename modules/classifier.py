@@ -1,11 +1,11 @@
 """Module 1 - Business Model Classifier."""
 
 import streamlit as st
-import pandas as pd
 
 from data.questions import MODULE_1_QUESTIONS
 from data.recommendations import BUSINESS_MODELS
-from data.comp_table import get_comps_by_model
+from data.comp_table import get_comps_df
+from utils.navigation import rerun_if_navigated
 from utils.scoring import classify_business_model
 
 
@@ -15,22 +15,33 @@ _MODEL_ICONS = {
     "AI-enabled Service": "\U0001f3e2",
 }
 
+# Per-question option lookups, built once at import
+_M1_LABEL2VAL = {
+    q["id"]: {opt["label"]: opt["value"] for opt in q["options"]}
+    for q in MODULE_1_QUESTIONS
+}
+_M1_LABELS = {
+    q["id"]: tuple(opt["label"] for opt in q["options"])
+    for q in MODULE_1_QUESTIONS
+}
+_M1_EXAMPLES = {
+    q["id"]: {opt["label"]: opt.get("example") for opt in q["options"]}
+    for q in MODULE_1_QUESTIONS
+}
+
 
 def _collect_answers():
     """Read current radio selections and map labels back to option values."""
     answers = {}
-    for q in MODULE_1_QUESTIONS:
-        selected_label = st.session_state.get(f"radio_{q['id']}")
-        if selected_label is None:
-            continue
-        for opt in q["options"]:
-            if opt["label"] == selected_label:
-                answers[q["id"]] = opt["value"]
-                break
+    for q_id, label_to_value in _M1_LABEL2VAL.items():
+        selected_label = st.session_state.get(f"radio_{q_id}")
+        if selected_label in label_to_value:
+            answers[q_id] = label_to_value[selected_label]
     return answers
 
 
 def render_classifier():
+    ss = st.session_state
     st.header("What type of AI business are you building?")
     st.markdown(
         "Your AI business model determines which pricing structures make sense. "
@@ -42,17 +53,15 @@ def render_classifier():
     for q in MODULE_1_QUESTIONS:
         selected = st.radio(
             q["text"],
-            options=[opt["label"] for opt in q["options"]],
+            options=_M1_LABELS[q["id"]],
             key=f"radio_{q['id']}",
             index=None,
             help=q["help_text"],
         )
         # Show example for the selected option
-        if selected and q.get("options"):
-            for opt in q["options"]:
-                if opt["label"] == selected and opt.get("example"):
-                    st.caption(f"*{opt['example']}*")
-                    break
+        example = _M1_EXAMPLES[q["id"]].get(selected)
+        if example:
+            st.caption(f"*{example}*")
 
     # ---- Classify button --------------------------------------------------
     if st.button("Classify My Business \u2192", type="primary"):
@@ -61,18 +70,22 @@ def render_classifier():
             st.warning("Please answer at least one question before classifying.")
         else:
             model, confidence = classify_business_model(answers)
-            st.session_state.classifier_answers = answers
-            st.session_state.business_model = model
-            st.session_state.model_confidence = confidence
+            ss.classifier_answers = answers
+            ss.business_model = model
+            ss.model_confidence = confidence
 
     # ---- Results (persist after classification) ---------------------------
-    if st.session_state.business_model:
+    if ss.business_model:
         _show_results()
 
 
+@st.fragment
 def _show_results():
-    model = st.session_state.business_model
-    confidence = st.session_state.model_confidence
+    ss = st.session_state
+    rerun_if_navigated("1. Classify Business")
+
+    model = ss.business_model
+    confidence = ss.model_confidence
     model_data = BUSINESS_MODELS[model]
     icon = _MODEL_ICONS.get(model, "")
 
@@ -87,10 +100,8 @@ def _show_results():
                 st.markdown(f"- {ex}")
 
     st.subheader("Companies with similar models")
-    comps = get_comps_by_model(model)
-    if comps:
-        df = pd.DataFrame(comps).drop(columns=["model_type"])
-        df.columns = ["Company", "Pricing Model", "Detail", "Value Driver"]
+    df = get_comps_df(model)
+    if df is not None:
         st.dataframe(df, hide_index=True, use_container_width=True)
 
     st.divider()
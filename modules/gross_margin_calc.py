@@ -1,7 +1,59 @@
 """Gross Margin Calculator - quick scratch pad for margin math."""
 
 import streamlit as st
-import plotly.graph_objects as go
+
+
+# Static benchmark chart spec; only the "Your Margin" bar changes per render
+_MARGIN_CHART_SPEC = {
+    "data": [
+        {
+            "type": "bar",
+            "y": ["SaaS Benchmark", "AI Average", "Your Margin"],
+            "x": [80, 55, 0],
+            "orientation": "h",
+            "marker": {"color": ["#64748B", "#64748B", "#64748B"]},
+            "text": ["80%", "55%", ""],
+            "textposition": "outside",
+            "textfont": {"size": 13},
+        }
+    ],
+    "layout": {
+        "height": 150,
+        "margin": {"l": 0, "r": 35, "t": 0, "b": 0},
+        "xaxis": {"range": [0, 105], "visible": False},
+        "yaxis": {"autorange": "reversed", "tickfont": {"size": 13}},
+        "plot_bgcolor": "rgba(0,0,0,0)",
+        "paper_bgcolor": "rgba(0,0,0,0)",
+        "font": {"color": "#F8FAFC"},
+        "showlegend": False,
+        "uirevision": "static",
+    },
+}
+
+# The benchmark bar is read-only; the modebar only adds payload and clutter
+_CHART_CONFIG = {"displayModeBar": False}
+
+
+def _margin_chart(margin, bar_color):
+    """Benchmark bar chart, built once per session and patched on each render.
+
+    The figure lives in session state rather than st.cache_resource so two
+    sessions never patch the same object concurrently. It stays a go.Figure
+    because st.plotly_chart re-validates plain dict figures on every call.
+    """
+    fig = st.session_state.get("_gmc_fig")
+    if fig is None:
+        # Deferred: plotly is only needed once the chart is first drawn
+        import plotly.graph_objects as go
+
+        fig = go.Figure(_MARGIN_CHART_SPEC)
+        st.session_state._gmc_fig = fig
+
+    bar = fig.data[0]
+    bar.x = [80, 55, margin]
+    bar.text = ["80%", "55%", f"{margin:.0f}%"]
+    bar.marker.color = ["#64748B", "#64748B", bar_color]
+    return fig
 
 
 def render_gross_margin_calc():
@@ -81,26 +133,8 @@ def render_gross_margin_calc():
     else:
         bar_color = "#EF4444"
 
-    fig = go.Figure()
-    fig.add_trace(
-        go.Bar(
-            y=["SaaS Benchmark", "AI Average", "Your Margin"],
-            x=[80, 55, margin],
-            orientation="h",
-            marker_color=["#64748B", "#64748B", bar_color],
-            text=["80%", "55%", f"{margin:.0f}%"],
-            textposition="outside",
-            textfont=dict(size=13),
-        )
-    )
-    fig.update_layout(
-        height=150,
-        margin=dict(l=0, r=35, t=0, b=0),
-        xaxis=dict(range=[0, 105], visible=False),
-        yaxis=dict(autorange="reversed", tickfont=dict(size=13)),
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color="#F8FAFC"),
-        showlegend=False,
+    st.plotly_chart(
+        _margin_chart(margin, bar_color),
+        use_container_width=True,
+        config=_CHART_CONFIG,
     )
-    st.plotly_chart(fig, use_container_width=True)
@@ -5,13 +5,18 @@ import streamlit as st
 from data.questions import MODULE_4_QUESTIONS
 from data.recommendations import HEALTH_CHECK_ACTIONS
 from utils.scoring import calculate_health_score
-from utils.charts import create_radar_chart
 
-_RADAR_LABELS = [
+_RADAR_LABELS = (
     "AI Economics", "Model Fit", "Price Clarity", "Cost Management",
     "Free\u2192Paid", "AI Metrics", "Unit Economics", "Pricing Moat",
     "Sustainability", "Scalability",
-]
+)
+
+_M4_KEYS = tuple(f"m4_q{i}" for i in range(1, 11))
+
+_M4_QTEXT = {q["id"]: q["text"] for q in MODULE_4_QUESTIONS}
+
+_STARS = tuple("\u2b50" * n for n in range(6))
 
 _SCORE_BADGES = {
     "Early Stage": "\U0001f534 Early Stage - Focus on the fundamentals before scaling",
@@ -21,7 +26,17 @@ _SCORE_BADGES = {
 }
 
 
+@st.cache_resource(max_entries=1024, show_spinner=False)
+def _radar_chart(values, labels):
+    """Shared radar figure per score tuple - st.plotly_chart only reads it."""
+    # Deferred so importing this page doesn't pull in plotly
+    from utils.charts import create_radar_chart
+
+    return create_radar_chart(values, labels)
+
+
 def render_health_check():
+    ss = st.session_state
     st.header("Pricing Strategy Health Check")
     st.markdown(
         "Rate your confidence on each of these critical pricing dimensions. "
@@ -30,48 +45,56 @@ def render_health_check():
     st.caption("(1 = not at all confident, 5 = fully confident)")
 
     # ---- Questions --------------------------------------------------------
-    for q in MODULE_4_QUESTIONS:
-        st.slider(
-            q["text"],
-            min_value=q["min"],
-            max_value=q["max"],
-            value=q["default"],
-            key=f"slider_{q['id']}",
+    # Sliders only rerun the page when the form is submitted
+    with st.form("health_form"):
+        for q in MODULE_4_QUESTIONS:
+            st.slider(
+                q["text"],
+                min_value=q["min"],
+                max_value=q["max"],
+                value=q["default"],
+                key=f"slider_{q['id']}",
+            )
+
+        # ---- Score button -------------------------------------------------
+        submitted = st.form_submit_button(
+            "Score My Pricing Readiness \u2192", type="primary"
         )
 
-    # ---- Score button -----------------------------------------------------
-    if st.button("Score My Pricing Readiness \u2192", type="primary"):
+    if submitted:
         scores = {}
         for q in MODULE_4_QUESTIONS:
-            scores[q["id"]] = st.session_state.get(f"slider_{q['id']}", 3)
+            scores[q["id"]] = ss.get(f"slider_{q['id']}", 3)
 
         pct, label, priorities = calculate_health_score(scores)
-        st.session_state.health_scores = scores
-        st.session_state.overall_score = pct
-        st.session_state.health_label = label
-        st.session_state.priority_areas = priorities
+        ss.health_scores = scores
+        ss.overall_score = pct
+        ss.health_label = label
+        ss.priority_areas = priorities
 
     # ---- Results ----------------------------------------------------------
-    if st.session_state.health_scores:
+    if ss.health_scores:
         _show_results()
 
 
+@st.fragment
 def _show_results():
-    scores = st.session_state.health_scores
-    pct = st.session_state.overall_score
-    label = st.session_state.get("health_label", "Developing")
-    priorities = st.session_state.priority_areas
+    ss = st.session_state
+    scores = ss.health_scores
+    pct = ss.overall_score
+    label = ss.get("health_label", "Developing")
+    priorities = ss.priority_areas
 
     st.divider()
 
-    # Score values in question order for the radar chart
-    score_values = [scores.get(f"m4_q{i}", 3) for i in range(1, 11)]
+    # Score values in question order - a tuple, as it keys the radar cache
+    score_values = tuple(scores.get(k, 3) for k in _M4_KEYS)
 
     # Two-column layout: radar chart + score badge
     col_chart, col_score = st.columns([2, 1])
 
     with col_chart:
-        fig = create_radar_chart(score_values, _RADAR_LABELS)
+        fig = _radar_chart(score_values, _RADAR_LABELS)
         st.plotly_chart(fig, use_container_width=True)
 
     with col_score:
@@ -80,7 +103,7 @@ def _show_results():
         st.markdown(f"### {badge}")
 
     # ---- Priority actions -------------------------------------------------
-    all_high = all(v >= 4 for v in scores.values())
+    all_high = min(score_values) >= 4
 
     if all_high:
         st.success(
@@ -90,11 +113,9 @@ def _show_results():
     else:
         st.subheader("\U0001f3af Your Top 3 Priority Areas")
         for q_id in priorities:
-            q_text = next(
-                (q["text"] for q in MODULE_4_QUESTIONS if q["id"] == q_id), ""
-            )
+            q_text = _M4_QTEXT.get(q_id, "")
             score = scores.get(q_id, 0)
-            stars = "\u2b50" * score
+            stars = _STARS[score]
             action = HEALTH_CHECK_ACTIONS.get(q_id, "")
 
             with st.container(border=True):
@@ -1,11 +1,10 @@
 """Module 3 - Pricing Model Recommender."""
 
 import streamlit as st
-import pandas as pd
 
 from data.questions import MODULE_3_QUESTIONS
 from data.recommendations import get_pricing_recommendation
-from data.comp_table import get_comps_by_model
+from data.comp_table import get_comps_by_model, get_comps_df
 from utils.scoring import generate_pricing_formula
 
 
@@ -37,6 +36,12 @@ _BVP_PRINCIPLES = {
     ],
 }
 
+# Principles pre-joined into markdown bullet lists
+_BVP_BLOCKS = {
+    model: "\n".join(f"- {p}" for p in principles)
+    for model, principles in _BVP_PRINCIPLES.items()
+}
+
 _MODEL_ICONS = {
     "Per-seat + Feature Tiers": "\U0001f4ba",
     "Hybrid (Base + Usage Tiers)": "\U0001f504",
@@ -47,30 +52,45 @@ _MODEL_ICONS = {
     "Workflow-based + SLA Tiers": "\u2699\ufe0f",
 }
 
+# Option lookups for the radio questions, built once at import
+_M3_LABEL2VAL = {
+    q["id"]: {opt["label"]: opt["value"] for opt in q["options"]}
+    for q in MODULE_3_QUESTIONS
+    if q["type"] == "radio" and q["options"]
+}
+_M3_LABELS = {
+    q_id: tuple(label_to_value) for q_id, label_to_value in _M3_LABEL2VAL.items()
+}
+
+# Widget keys per question - radios are keyed "radio_", inputs "input_"
+_M3_WIDGET_KEYS = {
+    q["id"]: f"radio_{q['id']}" if q["type"] == "radio" else f"input_{q['id']}"
+    for q in MODULE_3_QUESTIONS
+}
+
 
 def _collect_answers():
     """Read current widget selections for Module 3 questions."""
     answers = {}
     for q in MODULE_3_QUESTIONS:
         if q["type"] in ("number", "slider"):
-            val = st.session_state.get(f"input_{q['id']}")
+            val = st.session_state.get(_M3_WIDGET_KEYS[q["id"]])
             if val is not None:
                 answers[q["id"]] = val
-        elif q["type"] == "radio" and q["options"]:
-            selected_label = st.session_state.get(f"radio_{q['id']}")
-            if selected_label is not None:
-                for opt in q["options"]:
-                    if opt["label"] == selected_label:
-                        answers[q["id"]] = opt["value"]
-                        break
+        elif q["id"] in _M3_LABEL2VAL:
+            label_to_value = _M3_LABEL2VAL[q["id"]]
+            selected_label = st.session_state.get(_M3_WIDGET_KEYS[q["id"]])
+            if selected_label in label_to_value:
+                answers[q["id"]] = label_to_value[selected_label]
     return answers
 
 
 def render_pricing_rec():
+    ss = st.session_state
     st.header("Your Pricing Model Recommendation")
 
-    business_model = st.session_state.business_model
-    quadrant = st.session_state.quadrant
+    business_model = ss.business_model
+    quadrant = ss.quadrant
 
     # Gate on Modules 1 & 2
     if not business_model or not quadrant:
@@ -90,77 +110,87 @@ def render_pricing_rec():
         f"**{quadrant}** quadrant"
     )
 
-    # ---- Questions --------------------------------------------------------
-    for q in MODULE_3_QUESTIONS:
-        if q["type"] == "number" and q["id"] == "m3_q1":
-            # Cost-per-unit input with Unit Cost Calculator integration
-            calc_cost = st.session_state.get("calculated_unit_cost")
-            default_val = calc_cost if calc_cost is not None else 1.00
-            st.number_input(
-                q["text"],
-                min_value=0.01,
-                value=default_val,
-                step=0.50,
-                format="%.2f",
-                key=f"input_{q['id']}",
-                help=q["help_text"],
-            )
-            def _go_to_tools():
-                st.session_state.nav_module = "\U0001f9ee Tools"
+    # ---- Unit Cost Calculator link ----------------------------------------
+    # Kept above the form - plain buttons can't live inside st.form
+    calc_cost = ss.get("calculated_unit_cost")
+
+    def _go_to_tools():
+        st.session_state.nav_module = "\U0001f9ee Tools"
+
+    if calc_cost is not None:
+        st.caption(
+            f"Pre-filled from Unit Cost Calculator "
+            f"(${calc_cost:.4f}). You can override this."
+        )
+        st.button(
+            "Recalculate in Unit Cost Calculator \u2192",
+            on_click=_go_to_tools,
+            key="recalc_unit_cost",
+        )
+    else:
+        st.caption("Not sure what your cost per unit is?")
+        st.button(
+            "Open Unit Cost Calculator \u2192",
+            on_click=_go_to_tools,
+            key="go_to_unit_calc",
+        )
 
-            if calc_cost is not None:
-                st.caption(
-                    f"Pre-filled from Unit Cost Calculator "
-                    f"(${calc_cost:.4f}). You can override this."
+    # ---- Questions --------------------------------------------------------
+    # Inputs only rerun the page when the form is submitted
+    with st.form("pricing_form"):
+        for q in MODULE_3_QUESTIONS:
+            if q["type"] == "number" and q["id"] == "m3_q1":
+                # Cost-per-unit input, pre-filled from the Unit Cost Calculator
+                default_val = calc_cost if calc_cost is not None else 1.00
+                st.number_input(
+                    q["text"],
+                    min_value=0.01,
+                    value=default_val,
+                    step=0.50,
+                    format="%.2f",
+                    key=_M3_WIDGET_KEYS[q["id"]],
+                    help=q["help_text"],
                 )
-                st.button(
-                    "Recalculate in Unit Cost Calculator \u2192",
-                    on_click=_go_to_tools,
-                    key="recalc_unit_cost",
+            elif q["type"] == "number":
+                st.number_input(
+                    q["text"],
+                    min_value=0.01,
+                    value=1.00,
+                    step=0.50,
+                    format="%.2f",
+                    key=_M3_WIDGET_KEYS[q["id"]],
+                    help=q["help_text"],
                 )
-            else:
-                st.caption("Not sure what your cost per unit is?")
-                st.button(
-                    "Open Unit Cost Calculator \u2192",
-                    on_click=_go_to_tools,
-                    key="go_to_unit_calc",
+            elif q["type"] == "slider":
+                st.slider(
+                    q["text"],
+                    min_value=q["min"],
+                    max_value=q["max"],
+                    value=q["default"],
+                    key=_M3_WIDGET_KEYS[q["id"]],
+                    help=q["help_text"],
                 )
-        elif q["type"] == "number":
-            st.number_input(
-                q["text"],
-                min_value=0.01,
-                value=1.00,
-                step=0.50,
-                format="%.2f",
-                key=f"input_{q['id']}",
-                help=q["help_text"],
-            )
-        elif q["type"] == "slider":
-            st.slider(
-                q["text"],
-                min_value=q["min"],
-                max_value=q["max"],
-                value=q["default"],
-                key=f"input_{q['id']}",
-                help=q["help_text"],
-            )
-        elif q["type"] == "radio" and q["options"]:
-            selected = st.radio(
-                q["text"],
-                options=[opt["label"] for opt in q["options"]],
-                key=f"radio_{q['id']}",
-                index=None,
-                help=q["help_text"],
-            )
-            # Show example for the selected option
-            if selected:
-                for opt in q["options"]:
-                    if opt["label"] == selected and opt.get("example"):
-                        st.caption(f"*{opt['example']}*")
-                        break
-
-    # ---- Generate button --------------------------------------------------
-    if st.button("Generate My Pricing Model \u2192", type="primary"):
+            elif q["type"] == "radio" and q["options"]:
+                selected = st.radio(
+                    q["text"],
+                    options=_M3_LABELS[q["id"]],
+                    key=_M3_WIDGET_KEYS[q["id"]],
+                    index=None,
+                    help=q["help_text"],
+                )
+                # Show example for the selected option
+                if selected:
+                    for opt in q["options"]:
+                        if opt["label"] == selected and opt.get("example"):
+                            st.caption(f"*{opt['example']}*")
+                            break
+
+        # ---- Generate button ----------------------------------------------
+        submitted = st.form_submit_button(
+            "Generate My Pricing Model \u2192", type="primary"
+        )
+
+    if submitted:
         answers = _collect_answers()
 
         cost = answers.get("m3_q1", 1.0)
@@ -171,28 +201,26 @@ def render_pricing_rec():
 
         rec = get_pricing_recommendation(business_model, quadrant, cost_variance)
         formula = generate_pricing_formula(
-            cost_per_unit=cost,
-            target_margin=target_margin,
-            deal_size=deal_size,
-            formula_type=rec["formula_type"],
-            customer_segment=customer_segment,
+            cost, target_margin, deal_size, rec["formula_type"], customer_segment
         )
 
-        st.session_state.pricing_answers = answers
-        st.session_state.recommended_model = rec["model_name"]
-        st.session_state.pricing_recommendation = rec
-        st.session_state.pricing_formula = formula
+        ss.pricing_answers = answers
+        ss.recommended_model = rec["model_name"]
+        ss.pricing_recommendation = rec
+        ss.pricing_formula = formula
 
     # ---- Results ----------------------------------------------------------
-    if st.session_state.recommended_model:
+    if ss.recommended_model:
         _show_results()
 
 
+@st.fragment
 def _show_results():
-    rec = st.session_state.pricing_recommendation
-    formula = st.session_state.pricing_formula
-    business_model = st.session_state.business_model
-    quadrant = st.session_state.quadrant
+    ss = st.session_state
+    rec = ss.pricing_recommendation
+    formula = ss.pricing_formula
+    business_model = ss.business_model
+    quadrant = ss.quadrant
     model_name = rec.get("model_name", "")
     icon = _MODEL_ICONS.get(model_name, "\U0001f4ca")
 
@@ -210,22 +238,22 @@ def _show_results():
         c1, c2, c3 = st.columns(3)
         c1.metric(
             "Platform Fee",
-            f"${formula.get('platform_fee_annual', 0):,.0f}/yr",
-            f"${formula.get('platform_fee_monthly', 0):,.0f}/mo",
+            f"${formula.platform_fee_annual:,.0f}/yr",
+            f"${formula.platform_fee_monthly:,.0f}/mo",
         )
-        c2.metric("Included Units/yr", f"{formula.get('included_units', 0):,}")
+        c2.metric("Included Units/yr", f"{formula.included_units:,}")
         c3.metric(
             "Overage Rate",
-            f"${formula.get('overage_rate', 0):,.2f}/unit",
+            f"${formula.overage_rate:,.2f}/unit",
         )
 
         c4, c5 = st.columns(2)
         c4.metric(
             "Effective Price/Unit",
-            f"${formula.get('effective_price_per_unit', 0):,.2f}",
+            f"${formula.effective_price_per_unit:,.2f}",
         )
 
-        margin = formula.get("gross_margin", 0)
+        margin = formula.gross_margin
         delta = margin - 55
         c5.metric(
             "Gross Margin",
@@ -233,8 +261,8 @@ def _show_results():
             delta=f"{delta:+.0f}% vs AI avg",
         )
 
-        if formula.get("explanation"):
-            st.caption(formula["explanation"])
+        if formula.explanation:
+            st.caption(formula.explanation)
 
         st.caption(
             "*These are starting points. Use the friction test: "
@@ -246,14 +274,15 @@ def _show_results():
     with st.container(border=True):
         st.subheader("How others do it")
         if comps:
-            df = pd.DataFrame(comps).drop(columns=["model_type"])
-            df.columns = ["Company", "Pricing Model", "Detail", "Value Driver"]
-            st.dataframe(df, hide_index=True, use_container_width=True)
+            st.dataframe(
+                get_comps_df(business_model).head(3),
+                hide_index=True,
+                use_container_width=True,
+            )
 
     # -- BVP principles -----------------------------------------------------
-    principles = _BVP_PRINCIPLES.get(business_model, [])
-    if principles:
-        lines = "\n".join(f"- {p}" for p in principles)
+    lines = _BVP_BLOCKS.get(business_model, "")
+    if lines:
         st.info(f"**BVP Pricing Principles for {business_model}s:**\n\n{lines}")
 
     # -- Screenshot-ready summary -------------------------------------------
@@ -265,12 +294,12 @@ def _show_results():
         st.markdown(f"**Recommended Pricing:** {model_name}")
         st.markdown(
             f"**Platform Fee:** "
-            f"${formula.get('platform_fee_annual', 0):,.0f}/yr "
-            f"(${formula.get('platform_fee_monthly', 0):,.0f}/mo)"
+            f"${formula.platform_fee_annual:,.0f}/yr "
+            f"(${formula.platform_fee_monthly:,.0f}/mo)"
         )
         st.markdown(
-            f"**Included Units:** {formula.get('included_units', 0):,}/yr | "
-            f"**Overage:** ${formula.get('overage_rate', 0):,.2f}/unit"
+            f"**Included Units:** {formula.included_units:,}/yr | "
+            f"**Overage:** ${formula.overage_rate:,.2f}/unit"
         )
         st.markdown(f"**Gross Margin:** {margin:.0f}%")
         if comps:
@@ -3,6 +3,8 @@
 import streamlit as st
 import plotly.graph_objects as go
 
+from utils.navigation import rerun_if_navigated
+
 
 # Blended cost per 1K tokens (approximate averages of input + output pricing)
 _LLM_PRESETS = {
@@ -13,6 +15,60 @@ _LLM_PRESETS = {
     "Open source / self-hosted": 0.001,
     "Other / custom": None,
 }
+_LLM_PRESET_NAMES = tuple(_LLM_PRESETS)
+
+# Cost breakdown bar segments, in stacking order
+_BAR_NAMES = ("AI/Inference", "Human Review", "Infrastructure")
+_BAR_COLORS = ("#0EA5E9", "#8B5CF6", "#64748B")
+_BAR_TEXTFONT = dict(size=11, color="#fff")
+
+_BREAKDOWN_LAYOUT = dict(
+    barmode="stack",
+    height=80,
+    margin=dict(l=0, r=0, t=0, b=0),
+    xaxis=dict(range=[0, 100], visible=False),
+    yaxis=dict(visible=False),
+    plot_bgcolor="rgba(0,0,0,0)",
+    paper_bgcolor="rgba(0,0,0,0)",
+    font=dict(color="#F8FAFC"),
+    legend=dict(orientation="h", yanchor="top", y=-0.3),
+    showlegend=True,
+    uirevision="static",
+)
+
+# The breakdown bar is read-only; the modebar only adds payload and clutter
+_CHART_CONFIG = {"displayModeBar": False}
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _cost_breakdown_chart(pcts):
+    """Stacked cost-share bar, shared per (inference, human, infra) % tuple."""
+    # Plain trace dicts - go.Figure validates them once, where go.Bar
+    # objects would be validated on construction and again when copied in
+    bars = [
+        {
+            "type": "bar",
+            "y": ["Cost Breakdown"],
+            "x": [pct],
+            "orientation": "h",
+            "name": name,
+            "marker": {"color": color},
+            "text": f"{pct:.0f}%" if pct >= 5 else "",
+            "textposition": "inside",
+            "textfont": _BAR_TEXTFONT,
+            "hovertemplate": f"{name}: {pct:.1f}%<extra></extra>",
+        }
+        for name, pct, color in zip(_BAR_NAMES, pcts, _BAR_COLORS)
+        if pct > 0  # zero-width segments draw nothing
+    ]
+    fig = go.Figure(data=bars, layout=_BREAKDOWN_LAYOUT)
+    return fig
+
+
+def _use_in_step3():
+    """Save the calculated unit cost and jump to Step 3."""
+    st.session_state.calculated_unit_cost = st.session_state.get("_ucc_total", 0.0)
+    st.session_state.nav_module = "3. Pricing Model"
 
 
 def render_unit_cost_calc():
@@ -34,7 +90,7 @@ def render_unit_cost_calc():
         "completed, one invoice processed, one meeting summarized, "
         "one translation delivered"
     )
-    unit_description = st.text_input(
+    st.text_input(
         "Describe your unit of value",
         placeholder="e.g., one support ticket resolved",
         help=(
@@ -59,7 +115,7 @@ def render_unit_cost_calc():
         if calc_method == "I know my token usage":
             provider = st.selectbox(
                 "LLM Provider",
-                list(_LLM_PRESETS.keys()),
+                _LLM_PRESET_NAMES,
                 key="ucc_provider",
             )
 
@@ -109,7 +165,7 @@ def render_unit_cost_calc():
             )
 
             inference_cost = (tokens / 1000) * cost_per_1k * calls
-            st.metric("Inference cost per unit", f"${inference_cost:.4f}")
+            st.caption(f"\u2248 ${inference_cost:.4f} per unit")
 
         else:  # monthly bill approach
             monthly_spend = st.number_input(
@@ -141,7 +197,7 @@ def render_unit_cost_calc():
             )
 
             inference_cost = monthly_spend / units_per_month
-            st.metric("Inference cost per unit", f"${inference_cost:.4f}")
+            st.caption(f"\u2248 ${inference_cost:.4f} per unit")
 
     # -- Section 2: Human-in-the-Loop Costs --------------------------------
     human_cost = 0.0
@@ -215,7 +271,7 @@ def render_unit_cost_calc():
             )
 
             human_cost = (review_pct / 100) * (minutes / 60) * hourly_cost
-            st.metric("Human cost per unit", f"${human_cost:.2f}")
+            st.caption(f"\u2248 ${human_cost:.4f} per unit")
         else:
             st.caption(
                 "No human review cost -- fully automated. Nice!"
@@ -259,9 +315,20 @@ def render_unit_cost_calc():
         )
 
         infra_cost = monthly_infra / monthly_units
-        st.metric("Infrastructure cost per unit", f"${infra_cost:.4f}")
+        st.caption(f"\u2248 ${infra_cost:.4f} per unit")
 
     # -- Total Cost Summary ------------------------------------------------
+    # Handed over via session state so the fragment reads the latest costs
+    st.session_state._ucc_costs = (inference_cost, human_cost, infra_cost)
+    _render_cost_summary()
+
+
+@st.fragment
+def _render_cost_summary():
+    """Totals, breakdown chart and the Use-in-Step-3 button."""
+    rerun_if_navigated("\U0001f9ee Tools")
+
+    inference_cost, human_cost, infra_cost = st.session_state._ucc_costs
     total_cost = inference_cost + human_cost + infra_cost
 
     st.divider()
@@ -278,45 +345,18 @@ def render_unit_cost_calc():
         help="This is your fully-loaded cost to deliver one unit of value.",
     )
 
-    # Cost breakdown bar chart
-    if total_cost > 0:
-        pcts = [
-            inference_cost / total_cost * 100,
-            human_cost / total_cost * 100,
-            infra_cost / total_cost * 100,
-        ]
-        fig = go.Figure()
-        colors = ["#0EA5E9", "#8B5CF6", "#64748B"]
-        names = ["AI/Inference", "Human Review", "Infrastructure"]
-        for name, pct, color in zip(names, pcts, colors):
-            fig.add_trace(
-                go.Bar(
-                    y=["Cost Breakdown"],
-                    x=[pct],
-                    orientation="h",
-                    name=name,
-                    marker_color=color,
-                    text=f"{pct:.0f}%" if pct >= 5 else "",
-                    textposition="inside",
-                    textfont=dict(size=11, color="#fff"),
-                    hovertemplate=f"{name}: {pct:.1f}%<extra></extra>",
-                )
-            )
-        fig.update_layout(
-            barmode="stack",
-            height=80,
-            margin=dict(l=0, r=0, t=0, b=0),
-            xaxis=dict(range=[0, 100], visible=False),
-            yaxis=dict(visible=False),
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-            font=dict(color="#F8FAFC"),
-            legend=dict(orientation="h", yanchor="top", y=-0.3),
-            showlegend=True,
+    # Cost breakdown bar chart - skipped below the displayed $0.0001 precision
+    if total_cost >= 0.0001:
+        # Rounded to the hover precision so float jitter doesn't miss the cache
+        pcts = (
+            round(inference_cost / total_cost * 100, 1),
+            round(human_cost / total_cost * 100, 1),
+            round(infra_cost / total_cost * 100, 1),
         )
-        st.plotly_chart(fig, use_container_width=True)
+        fig = _cost_breakdown_chart(pcts)
+        st.plotly_chart(fig, use_container_width=True, config=_CHART_CONFIG)
 
-    unit_label = unit_description or "unit"
+    unit_label = st.session_state.get("ucc_unit_desc") or "unit"
     st.caption(f"Your unit: {unit_label}")
 
     if total_cost > 0:
@@ -326,11 +366,8 @@ def render_unit_cost_calc():
             f"${min_price:.2f} per {unit_label}."
         )
 
-    # Use in Step 3 button
-    def _use_in_step3():
-        st.session_state.calculated_unit_cost = total_cost
-        st.session_state.nav_module = "3. Pricing Model"
-
+    # Use in Step 3 button - the callback reads the total back from state
+    st.session_state._ucc_total = total_cost
     st.button(
         "Use this in Step 3 \u2192",
         type="primary",
@@ -4,25 +4,44 @@ import streamlit as st
 
 from data.questions import MODULE_2_QUESTIONS
 from data.recommendations import QUADRANTS
+from utils.navigation import rerun_if_navigated
 from utils.scoring import calculate_value_position
 from utils.charts import create_value_framework_chart
 
 
+# Per-question option lookups, built once at import
+_M2_LABEL2VAL = {
+    q["id"]: {opt["label"]: opt["value"] for opt in q["options"]}
+    for q in MODULE_2_QUESTIONS
+}
+
+# Everything the question loop renders: (widget key, text, option labels,
+# label -> example, help text)
+_M2_QUESTION_VIEW = tuple(
+    (
+        f"radio_{q['id']}",
+        q["text"],
+        tuple(opt["label"] for opt in q["options"]),
+        {opt["label"]: opt.get("example") for opt in q["options"]},
+        q["help_text"],
+    )
+    for q in MODULE_2_QUESTIONS
+)
+
+
 def _collect_answers():
     """Read current radio selections and map labels back to option values."""
     answers = {}
     for q in MODULE_2_QUESTIONS:
+        label_to_value = _M2_LABEL2VAL[q["id"]]
         selected_label = st.session_state.get(f"radio_{q['id']}")
-        if selected_label is None:
-            continue
-        for opt in q["options"]:
-            if opt["label"] == selected_label:
-                answers[q["id"]] = opt["value"]
-                break
+        if selected_label in label_to_value:
+            answers[q["id"]] = label_to_value[selected_label]
     return answers
 
 
 def render_value_mapper():
+    ss = st.session_state
     st.header("Where does your product sit on the AI Value Framework?")
     st.markdown(
         "This 2x2 framework maps your pricing power and renewal risk. "
@@ -32,11 +51,11 @@ def render_value_mapper():
     )
 
     # ---- Progress summary -------------------------------------------------
-    if st.session_state.business_model:
+    if ss.business_model:
         st.caption(
             f"\u2705 Step 1 Complete: Classified as "
-            f"**{st.session_state.business_model}** "
-            f"({st.session_state.model_confidence:.0f}% confidence)"
+            f"**{ss.business_model}** "
+            f"({ss.model_confidence:.0f}% confidence)"
         )
     else:
         st.warning(
@@ -44,20 +63,18 @@ def render_value_mapper():
         )
 
     # ---- Questions --------------------------------------------------------
-    for q in MODULE_2_QUESTIONS:
+    for key, text, labels, examples, help_text in _M2_QUESTION_VIEW:
         selected = st.radio(
-            q["text"],
-            options=[opt["label"] for opt in q["options"]],
-            key=f"radio_{q['id']}",
+            text,
+            options=labels,
+            key=key,
             index=None,
-            help=q["help_text"],
+            help=help_text,
         )
         # Show example for the selected option
-        if selected and q.get("options"):
-            for opt in q["options"]:
-                if opt["label"] == selected and opt.get("example"):
-                    st.caption(f"*{opt['example']}*")
-                    break
+        example = examples.get(selected)
+        if example:
+            st.caption(f"*{example}*")
 
     # ---- Map button -------------------------------------------------------
     if st.button("Map My Position \u2192", type="primary"):
@@ -66,20 +83,24 @@ def render_value_mapper():
             st.warning("Please answer at least one question.")
         else:
             x, y, quadrant = calculate_value_position(answers)
-            st.session_state.value_answers = answers
-            st.session_state.x_score = x
-            st.session_state.y_score = y
-            st.session_state.quadrant = quadrant
+            ss.value_answers = answers
+            ss.x_score = x
+            ss.y_score = y
+            ss.quadrant = quadrant
 
     # ---- Results ----------------------------------------------------------
-    if st.session_state.quadrant:
+    if ss.quadrant:
         _show_results()
 
 
+@st.fragment
 def _show_results():
-    x = st.session_state.x_score
-    y = st.session_state.y_score
-    quadrant = st.session_state.quadrant
+    ss = st.session_state
+    rerun_if_navigated("2. Map Value")
+
+    x = ss.x_score
+    y = ss.y_score
+    quadrant = ss.quadrant
     quad_data = QUADRANTS[quadrant]
 
     st.divider()
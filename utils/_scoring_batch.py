@@ -0,0 +1,348 @@
+"""Vectorized batch scoring over many saved survey responses.
+
+Kept out of utils.scoring so the single-response path used by the app
+imports without NumPy or the dense tables; utils.scoring re-exports these
+names lazily on first access.
+"""
+
+from types import MappingProxyType
+
+import numpy as np
+
+from data.questions import MODULE_4_QUESTIONS
+from utils.scoring import (
+    _HEALTH_LABEL_CUTS,
+    _HEALTH_LABELS,
+    _M1_LOOKUP,
+    _M2_LOOKUP,
+    _MODEL_MAP,
+    _MODEL_NAMES,
+    _QUADRANTS,
+    _UNIT_TIER_CUTS,
+    _UNIT_TIER_UNITS,
+    _get_seats,
+)
+
+# Answers are encoded Structure-of-Arrays style: one int8 matrix per module,
+# shape (respondents, questions), holding option indices. Index 0 means
+# "unanswered"; real options start at 1. The dense score tables below are
+# indexed the same way, so a whole batch scores with one gather + sum.
+
+def _option_index(lookup):
+    return {
+        q_id: {value: i for i, value in enumerate(option_scores, start=1)}
+        for q_id, option_scores in lookup.items()
+    }
+
+
+_M1_DIMS = tuple(_MODEL_MAP)
+_M1_QIDS = tuple(_M1_LOOKUP)
+_M1_VIDX = _option_index(_M1_LOOKUP)
+
+# _M1_MATRIX[q, v] = (copilot, agent, service) scores of option v of question q
+_M1_MATRIX = np.zeros(
+    (len(_M1_QIDS), 1 + max(map(len, _M1_LOOKUP.values())), len(_M1_DIMS)),
+    dtype=np.int32,
+)
+for _q, _q_id in enumerate(_M1_QIDS):
+    for _value, _v in _M1_VIDX[_q_id].items():
+        _M1_MATRIX[_q, _v] = _M1_LOOKUP[_q_id][_value]
+
+_M2_QIDS = tuple(_M2_LOOKUP)
+_M2_VIDX = _option_index(_M2_LOOKUP)
+
+# _M2_MATRIX[q, v] = (x, y) scores of option v of question q
+_M2_MATRIX = np.zeros(
+    (len(_M2_QIDS), 1 + max(map(len, _M2_LOOKUP.values())), 2),
+    dtype=np.float64,
+)
+for _q, _q_id in enumerate(_M2_QIDS):
+    for _value, _v in _M2_VIDX[_q_id].items():
+        _M2_MATRIX[_q, _v] = _M2_LOOKUP[_q_id][_value]
+
+# Module 4 answers are 1-5 slider scores, so the score is its own index
+_M4_QIDS = tuple(q["id"] for q in MODULE_4_QUESTIONS)
+_M4_VIDX = {
+    q["id"]: {v: v for v in range(q["min"], q["max"] + 1)}
+    for q in MODULE_4_QUESTIONS
+}
+_M4_QID_ARRAY = np.array(_M4_QIDS)
+
+_ENCODINGS = MappingProxyType({
+    1: (_M1_QIDS, _M1_VIDX),
+    2: (_M2_QIDS, _M2_VIDX),
+    4: (_M4_QIDS, _M4_VIDX),
+})
+
+
+def encode_answers(answers, module):
+    """Encode answers as an int8 option-index matrix for batch scoring.
+
+    Args:
+        answers: sequence of answer dicts (question_id -> value), or a
+            DataFrame with one row per respondent and question ids as columns
+        module: 1, 2 or 4
+
+    Returns:
+        np.ndarray of shape (len(answers), n_questions), dtype int8.
+        Unanswered or unknown values (including missing columns and NaN)
+        encode as 0.
+    """
+    q_ids, vidx = _ENCODINGS[module]
+    encoded = np.zeros((len(answers), len(q_ids)), dtype=np.int8)
+
+    if hasattr(answers, "columns"):  # DataFrame - map whole columns at once
+        for col, q_id in enumerate(q_ids):
+            if q_id in answers.columns:
+                encoded[:, col] = (
+                    answers[q_id].map(vidx[q_id]).fillna(0).to_numpy(np.int8)
+                )
+        return encoded
+
+    for col, q_id in enumerate(q_ids):
+        index = vidx[q_id]
+        encoded[:, col] = [index.get(row.get(q_id), 0) for row in answers]
+    return encoded
+
+
+def _as_encoded(answers, module):
+    if isinstance(answers, np.ndarray):
+        return answers
+    return encode_answers(answers, module)
+
+
+def _round_builtin(values, ndigits):
+    # np.round scales by 10**ndigits first, so on decimal ties it can
+    # disagree with the built-in round() the single-respondent scorers use.
+    # Scores take few distinct values, so round each one with round().
+    unique, inverse = np.unique(values, return_inverse=True)
+    return np.array([round(v, ndigits) for v in unique.tolist()])[inverse]
+
+
+def classify_business_model_batch(encoded):
+    """Classify many Module 1 answer sets in one vectorized pass.
+
+    Same result per respondent as classify_business_model.
+
+    Args:
+        encoded: int8 matrix from encode_answers(answers, 1), or raw
+            answers (DataFrame or list of dicts) to encode first
+
+    Returns:
+        (models, confidences) - a list of model names and a float array of
+        confidence percentages, one entry per respondent.
+    """
+    encoded = _as_encoded(encoded, 1)
+    totals = _M1_MATRIX[np.arange(len(_M1_QIDS)), encoded].sum(axis=1)
+
+    top = totals.argmax(axis=1)
+    total = totals.sum(axis=1)
+    top_score = totals[np.arange(len(top)), top]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        confidence = np.where(total > 0, top_score / total * 100, 0.0)
+
+    return [_MODEL_NAMES[i] for i in top], _round_builtin(confidence, 1)
+
+
+def calculate_value_position_batch(encoded):
+    """Value framework positions for many Module 2 answer sets.
+
+    Same result per respondent as calculate_value_position.
+
+    Args:
+        encoded: int8 matrix from encode_answers(answers, 2), or raw
+            answers (DataFrame or list of dicts) to encode first
+
+    Returns:
+        (x_scores, y_scores, quadrant_labels) - two float arrays and a list.
+    """
+    encoded = _as_encoded(encoded, 2)
+    sums = _M2_MATRIX[np.arange(len(_M2_QIDS)), encoded].sum(axis=1)
+    answered = np.count_nonzero(encoded, axis=1)[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xy = np.where(answered > 0, sums / answered, 0.0)
+    xy = np.clip(xy, -1.0, 1.0)
+    x, y = xy[:, 0], xy[:, 1]
+
+    quadrant_idx = (x >= 0).astype(np.intp) << 1 | (y > 0)
+    return (_round_builtin(x, 3), _round_builtin(y, 3),
+            [_QUADRANTS[i] for i in quadrant_idx])
+
+
+def calculate_health_score_batch(encoded):
+    """Health check scores for many Module 4 answer sets.
+
+    Same result per respondent as calculate_health_score, given answers in
+    question order.
+
+    Args:
+        encoded: int8 matrix from encode_answers(answers, 4), or raw
+            answers (DataFrame or list of dicts) to encode first
+
+    Returns:
+        (percentages, labels, priorities) - a float array, a list of labels
+        and an (N, 3) array of the lowest-scored question ids, padded with
+        "" when fewer than three questions were answered.
+    """
+    encoded = _as_encoded(encoded, 4)
+    answered = encoded > 0
+    total = encoded.sum(axis=1, dtype=np.int64)
+    max_possible = np.count_nonzero(answered, axis=1) * 5
+    # Same integer-tenths rounding as the single-respondent scorer
+    safe_max = np.maximum(max_possible, 1)
+    percentage = np.where(
+        max_possible > 0, (total * 2000 + safe_max) // (2 * safe_max) / 10, 0.0
+    )
+
+    label_idx = np.searchsorted(_HEALTH_LABEL_CUTS, percentage, side="right")
+
+    # Stable argsort rather than argpartition: ties must keep question
+    # order to match the single-respondent priorities. Unanswered
+    # questions sort last.
+    order = np.argsort(np.where(answered, encoded, 127), axis=1, kind="stable")[:, :3]
+    priorities = np.where(
+        np.take_along_axis(answered, order, axis=1), _M4_QID_ARRAY[order], ""
+    )
+    return percentage, [_HEALTH_LABELS[i] for i in label_idx], priorities
+
+
+def score_all_modules_batch(m1, m2, m4):
+    """Score Modules 1, 2 and 4 for the same respondents in one call.
+
+    Args:
+        m1, m2, m4: int8 matrices from encode_answers (or raw answers) for
+            modules 1, 2 and 4, with one row per respondent in the same order
+
+    Returns:
+        dict of equal-length columns, named like the session state keys
+        (pd.DataFrame(result) gives one row per respondent).
+    """
+    if not len(m1) == len(m2) == len(m4):
+        raise ValueError(
+            f"Row counts differ: m1={len(m1)}, m2={len(m2)}, m4={len(m4)}"
+        )
+
+    models, confidence = classify_business_model_batch(m1)
+    x, y, quadrants = calculate_value_position_batch(m2)
+    percentage, labels, priorities = calculate_health_score_batch(m4)
+    return {
+        "business_model": models,
+        "model_confidence": confidence,
+        "x_score": x,
+        "y_score": y,
+        "quadrant": quadrants,
+        "overall_score": percentage,
+        "health_label": labels,
+        "priority_areas": priorities.tolist(),
+    }
+
+
+def _cents(dollars):
+    # Array form of utils.scoring._cents; inputs are positive
+    return np.floor(dollars * 100 + 0.5)
+
+
+# Array variants of the formula wrappers in utils.scoring. All share the
+# (cost, price, margin, deal, units, segment) signature and return
+# (model_name, columns) with columns in PricingResult.to_dict() order.
+
+def _hybrid_batch(cost, price, margin, deal, units, segment):
+    fee_monthly_c = _cents(cost * units * 2)
+    fee_annual = fee_monthly_c * 12 / 100
+    included = np.maximum(1, np.trunc(fee_annual / (price * 1.5)))
+    gm = np.where(
+        fee_monthly_c > 0,
+        np.round((fee_annual - cost * included) / fee_annual * 100, 1),
+        0.0,
+    )
+    return "Hybrid (Base + Usage)", (
+        fee_annual, fee_monthly_c / 100, included,
+        _cents(price * 1.2) / 100, _cents(price) / 100, gm,
+    )
+
+
+def _outcome_batch(cost, price, margin, deal, units, segment):
+    min_commit_c = _cents(deal * 0.7)
+    fee_annual = min_commit_c / 100
+    price_per_outcome = _cents(price) / 100
+    return "Outcome-based", (
+        fee_annual, np.floor((min_commit_c + 6) / 12) / 100,
+        np.maximum(1, np.trunc(fee_annual / price)),
+        price_per_outcome, price_per_outcome, np.round(margin, 1),
+    )
+
+
+def _workflow_batch(cost, price, margin, deal, units, segment):
+    fee_monthly_c = _cents(units * price)
+    return "Workflow-based (Per Task)", (
+        fee_monthly_c * 12 / 100, fee_monthly_c / 100, units * 12,
+        _cents(price * 0.85) / 100, _cents(price) / 100, np.round(margin, 1),
+    )
+
+
+def _per_seat_batch(cost, price, margin, deal, units, segment):
+    seats = _get_seats(segment)
+    per_seat_c = _cents(deal / (12 * seats))
+    monthly_per_seat = per_seat_c / 100
+    cost_per_seat = cost * (units / seats)
+    gm = np.where(
+        per_seat_c > 0,
+        np.round((monthly_per_seat - cost_per_seat) / monthly_per_seat * 100, 1),
+        0.0,
+    )
+    return "Per-seat + Feature Tiers", (
+        per_seat_c * seats * 12 / 100, per_seat_c * seats / 100,
+        np.full(cost.shape, seats), np.floor((per_seat_c * 3 + 1) / 2) / 100,
+        monthly_per_seat, gm,
+    )
+
+
+_BATCH_FORMULA_DISPATCH = MappingProxyType({
+    "hybrid": _hybrid_batch,
+    "outcome": _outcome_batch,
+    "workflow": _workflow_batch,
+    "per_seat": _per_seat_batch,
+})
+
+_PRICING_COLUMNS = (
+    "platform_fee_annual",
+    "platform_fee_monthly",
+    "included_units",
+    "overage_rate",
+    "effective_price_per_unit",
+    "gross_margin",
+)
+
+
+def generate_pricing_formula_batch(cost_per_unit, target_margin, deal_size,
+                                   formula_type, customer_segment="mid_market"):
+    """generate_pricing_formula over whole grids of inputs, e.g. for sweeps.
+
+    cost_per_unit, target_margin and deal_size broadcast against each other;
+    formula_type and customer_segment are single values. Rows with invalid
+    inputs come back zeroed with an empty model name, like the scalar path.
+
+    Returns:
+        dict of broadcast arrays keyed like PricingResult.to_dict(), without
+        the explanation text.
+    """
+    cost, margin, deal = np.broadcast_arrays(
+        np.asarray(cost_per_unit, dtype=np.float64),
+        np.asarray(target_margin, dtype=np.float64),
+        np.asarray(deal_size, dtype=np.float64),
+    )
+    valid = (cost > 0) & (margin < 100)
+    units = np.asarray(_UNIT_TIER_UNITS)[
+        np.searchsorted(_UNIT_TIER_CUTS, deal, side="left")
+    ]
+
+    formula = _BATCH_FORMULA_DISPATCH.get(formula_type, _hybrid_batch)  # hybrid default
+    with np.errstate(divide="ignore", invalid="ignore"):
+        price = cost / (1 - margin / 100)
+        model_name, columns = formula(cost, price, margin, deal, units, customer_segment)
+
+    result = {"model_name": np.where(valid, model_name, "")}
+    for key, values in zip(_PRICING_COLUMNS, columns):
+        result[key] = np.where(valid, values, 0)
+    result["included_units"] = result["included_units"].astype(np.int64)
+    return result
@@ -3,6 +3,121 @@
 import plotly.graph_objects as go
 
 
+# Shared by every chart: transparent background, light text on dark theme
+_TRANSPARENT = "rgba(0,0,0,0)"
+_FONT = dict(color="#F8FAFC")
+
+
+# ---------------------------------------------------------------------------
+# Value Framework scaffold - static, only the position marker varies
+# ---------------------------------------------------------------------------
+
+_MARKER_STYLE = dict(size=20, color="#0EA5E9", line=dict(width=2, color="#fff"))
+
+# Quadrant background rectangles
+_QUADRANT_SHAPES = (
+    # Revenue Engine - top-right (green)
+    dict(
+        type="rect", x0=0, x1=1.3, y0=0, y1=1.3,
+        fillcolor="rgba(34, 197, 94, 0.10)", line=dict(width=0), layer="below",
+    ),
+    # Efficiency Machine - top-left (blue)
+    dict(
+        type="rect", x0=-1.3, x1=0, y0=0, y1=1.3,
+        fillcolor="rgba(59, 130, 246, 0.10)", line=dict(width=0), layer="below",
+    ),
+    # Promise Zone - bottom-right (yellow)
+    dict(
+        type="rect", x0=0, x1=1.3, y0=-1.3, y1=0,
+        fillcolor="rgba(234, 179, 8, 0.10)", line=dict(width=0), layer="below",
+    ),
+    # Danger Zone - bottom-left (red)
+    dict(
+        type="rect", x0=-1.3, x1=0, y0=-1.3, y1=0,
+        fillcolor="rgba(239, 68, 68, 0.10)", line=dict(width=0), layer="below",
+    ),
+    # Dashed zero-lines
+    dict(
+        type="line", x0=-1.3, x1=1.3, y0=0, y1=0,
+        line=dict(color="rgba(148,163,184,0.5)", width=1, dash="dash"),
+    ),
+    dict(
+        type="line", x0=0, x1=0, y0=-1.3, y1=1.3,
+        line=dict(color="rgba(148,163,184,0.5)", width=1, dash="dash"),
+    ),
+)
+
+# Quadrant label annotations (name + one-line description)
+_DESC_COLOR = "rgba(248, 250, 252, 0.5)"
+_QUADRANT_ANNOTATIONS = (
+    # Revenue Engine - top-right
+    dict(
+        x=0.85, y=1.15, text="Revenue Engine", showarrow=False,
+        font=dict(size=16, color="rgba(34, 197, 94, 0.85)"),
+    ),
+    dict(
+        x=0.85, y=1.0, text="Premium outcome-based pricing", showarrow=False,
+        font=dict(size=12, color=_DESC_COLOR),
+    ),
+    # Efficiency Machine - top-left
+    dict(
+        x=-0.85, y=1.15, text="Efficiency Machine", showarrow=False,
+        font=dict(size=16, color="rgba(59, 130, 246, 0.85)"),
+    ),
+    dict(
+        x=-0.85, y=1.0, text="Price against the alternative (TCO)", showarrow=False,
+        font=dict(size=12, color=_DESC_COLOR),
+    ),
+    # Promise Zone - bottom-right
+    dict(
+        x=0.85, y=-1.0, text="Promise Zone", showarrow=False,
+        font=dict(size=16, color="rgba(234, 179, 8, 0.85)"),
+    ),
+    dict(
+        x=0.85, y=-1.15, text="Hybrid pricing, must harden ROI over time",
+        showarrow=False, font=dict(size=12, color=_DESC_COLOR),
+    ),
+    # Danger Zone - bottom-left
+    dict(
+        x=-0.85, y=-1.0, text="Danger Zone", showarrow=False,
+        font=dict(size=16, color="rgba(239, 68, 68, 0.85)"),
+    ),
+    dict(
+        x=-0.85, y=-1.15, text="Highest renewal risk, prove value fast",
+        showarrow=False, font=dict(size=12, color=_DESC_COLOR),
+    ),
+)
+
+_XAXIS = dict(
+    range=[-1.3, 1.3],
+    title=dict(text="Cost Savings \u2190 \u2192 Revenue Uplift", font=dict(size=14)),
+    zeroline=False,
+    showgrid=False,
+    tickfont=dict(size=12),
+)
+_YAXIS = dict(
+    range=[-1.3, 1.3],
+    title=dict(text="Soft ROI \u2190 \u2192 Hard ROI", font=dict(size=14)),
+    zeroline=False,
+    showgrid=False,
+    tickfont=dict(size=12),
+)
+
+_BASE_LAYOUT = dict(
+    shapes=_QUADRANT_SHAPES,
+    annotations=_QUADRANT_ANNOTATIONS,
+    xaxis=_XAXIS,
+    yaxis=_YAXIS,
+    height=500,
+    margin=dict(l=60, r=60, t=30, b=60),
+    plot_bgcolor=_TRANSPARENT,
+    paper_bgcolor=_TRANSPARENT,
+    font=_FONT,
+    # Keeps the scaffold's UI state across reruns - only the marker moves
+    uirevision="value-framework",
+)
+
+
 def create_value_framework_chart(x_score, y_score):
     """Build the 2x2 Value Framework scatter chart.
 
@@ -13,120 +128,41 @@ def create_value_framework_chart(x_score, y_score):
     Returns:
         plotly Figure
     """
-    fig = go.Figure()
-
-    # User position marker
-    fig.add_trace(
-        go.Scatter(
-            x=[x_score],
-            y=[y_score],
-            mode="markers",
-            marker=dict(size=20, color="#0EA5E9", line=dict(width=2, color="#fff")),
-            name="Your Position",
-            showlegend=False,
-            hovertemplate="x: %{x:.2f}<br>y: %{y:.2f}<extra></extra>",
-        )
-    )
-
-    # Quadrant background rectangles
-    quadrant_shapes = [
-        # Revenue Engine - top-right (green)
-        dict(
-            type="rect", x0=0, x1=1.3, y0=0, y1=1.3,
-            fillcolor="rgba(34, 197, 94, 0.10)", line=dict(width=0), layer="below",
-        ),
-        # Efficiency Machine - top-left (blue)
-        dict(
-            type="rect", x0=-1.3, x1=0, y0=0, y1=1.3,
-            fillcolor="rgba(59, 130, 246, 0.10)", line=dict(width=0), layer="below",
-        ),
-        # Promise Zone - bottom-right (yellow)
-        dict(
-            type="rect", x0=0, x1=1.3, y0=-1.3, y1=0,
-            fillcolor="rgba(234, 179, 8, 0.10)", line=dict(width=0), layer="below",
-        ),
-        # Danger Zone - bottom-left (red)
-        dict(
-            type="rect", x0=-1.3, x1=0, y0=-1.3, y1=0,
-            fillcolor="rgba(239, 68, 68, 0.10)", line=dict(width=0), layer="below",
-        ),
-        # Dashed zero-lines
-        dict(
-            type="line", x0=-1.3, x1=1.3, y0=0, y1=0,
-            line=dict(color="rgba(148,163,184,0.5)", width=1, dash="dash"),
-        ),
-        dict(
-            type="line", x0=0, x1=0, y0=-1.3, y1=1.3,
-            line=dict(color="rgba(148,163,184,0.5)", width=1, dash="dash"),
-        ),
-    ]
-
-    # Quadrant label annotations (name + one-line description)
-    _desc_color = "rgba(248, 250, 252, 0.5)"
-    annotations = [
-        # Revenue Engine - top-right
-        dict(
-            x=0.85, y=1.15, text="Revenue Engine", showarrow=False,
-            font=dict(size=16, color="rgba(34, 197, 94, 0.85)"),
-        ),
-        dict(
-            x=0.85, y=1.0, text="Premium outcome-based pricing", showarrow=False,
-            font=dict(size=12, color=_desc_color),
-        ),
-        # Efficiency Machine - top-left
-        dict(
-            x=-0.85, y=1.15, text="Efficiency Machine", showarrow=False,
-            font=dict(size=16, color="rgba(59, 130, 246, 0.85)"),
-        ),
-        dict(
-            x=-0.85, y=1.0, text="Price against the alternative (TCO)", showarrow=False,
-            font=dict(size=12, color=_desc_color),
-        ),
-        # Promise Zone - bottom-right
-        dict(
-            x=0.85, y=-1.0, text="Promise Zone", showarrow=False,
-            font=dict(size=16, color="rgba(234, 179, 8, 0.85)"),
-        ),
-        dict(
-            x=0.85, y=-1.15, text="Hybrid pricing, must harden ROI over time",
-            showarrow=False, font=dict(size=12, color=_desc_color),
-        ),
-        # Danger Zone - bottom-left
-        dict(
-            x=-0.85, y=-1.0, text="Danger Zone", showarrow=False,
-            font=dict(size=16, color="rgba(239, 68, 68, 0.85)"),
-        ),
-        dict(
-            x=-0.85, y=-1.15, text="Highest renewal risk, prove value fast",
-            showarrow=False, font=dict(size=12, color=_desc_color),
-        ),
-    ]
-
-    fig.update_layout(
-        shapes=quadrant_shapes,
-        annotations=annotations,
-        xaxis=dict(
-            range=[-1.3, 1.3],
-            title=dict(text="Cost Savings \u2190 \u2192 Revenue Uplift", font=dict(size=14)),
-            zeroline=False,
-            showgrid=False,
-            tickfont=dict(size=12),
-        ),
-        yaxis=dict(
-            range=[-1.3, 1.3],
-            title=dict(text="Soft ROI \u2190 \u2192 Hard ROI", font=dict(size=14)),
-            zeroline=False,
-            showgrid=False,
+    # Only the user position marker is built per call, as a plain trace dict
+    # so go.Figure validates it once rather than on construction and copy
+    marker = {
+        "type": "scatter",
+        "x": [x_score],
+        "y": [y_score],
+        "mode": "markers",
+        "marker": _MARKER_STYLE,
+        "name": "Your Position",
+        "showlegend": False,
+        "hovertemplate": "x: %{x:.2f}<br>y: %{y:.2f}<extra></extra>",
+    }
+    return go.Figure(data=[marker], layout=_BASE_LAYOUT)
+
+
+_RADAR_LINE = dict(color="#0EA5E9", width=2)
+
+_RADAR_LAYOUT = dict(
+    polar=dict(
+        radialaxis=dict(
+            visible=True,
+            range=[0, 5],
+            tickvals=[1, 2, 3, 4, 5],
             tickfont=dict(size=12),
         ),
-        height=500,
-        margin=dict(l=60, r=60, t=30, b=60),
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color="#F8FAFC"),
-    )
-
-    return fig
+        angularaxis=dict(tickfont=dict(size=13)),
+        bgcolor=_TRANSPARENT,
+    ),
+    showlegend=False,
+    height=420,
+    margin=dict(l=80, r=80, t=40, b=40),
+    plot_bgcolor=_TRANSPARENT,
+    paper_bgcolor=_TRANSPARENT,
+    font=_FONT,
+)
 
 
 def create_radar_chart(scores, labels):
@@ -143,33 +179,12 @@ def create_radar_chart(scores, labels):
     r = list(scores) + [scores[0]]
     theta = list(labels) + [labels[0]]
 
-    fig = go.Figure(
-        data=go.Scatterpolar(
-            r=r,
-            theta=theta,
-            fill="toself",
-            fillcolor="rgba(14, 165, 233, 0.2)",
-            line=dict(color="#0EA5E9", width=2),
-        )
-    )
-
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 5],
-                tickvals=[1, 2, 3, 4, 5],
-                tickfont=dict(size=12),
-            ),
-            angularaxis=dict(tickfont=dict(size=13)),
-            bgcolor="rgba(0,0,0,0)",
-        ),
-        showlegend=False,
-        height=420,
-        margin=dict(l=80, r=80, t=40, b=40),
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)",
-        font=dict(color="#F8FAFC"),
-    )
-
-    return fig
+    polygon = {
+        "type": "scatterpolar",
+        "r": r,
+        "theta": theta,
+        "fill": "toself",
+        "fillcolor": "rgba(14, 165, 233, 0.2)",
+        "line": _RADAR_LINE,
+    }
+    return go.Figure(data=[polygon], layout=_RADAR_LAYOUT)
@@ -0,0 +1,14 @@
+"""Page navigation helpers shared by the app and its fragments."""
+
+import streamlit as st
+
+
+def rerun_if_navigated(page):
+    """Escalate to a full app rerun when a fragment's button switched pages.
+
+    A button inside an st.fragment only reruns that fragment, so the
+    sidebar and page router would keep showing ``page`` until the next
+    full rerun.
+    """
+    if st.session_state.nav_module != page:
+        st.rerun()
@@ -1,13 +1,51 @@
 """Scoring and calculation helpers for all modules."""
 
+import functools
 import sys
 import os
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from types import MappingProxyType
 
-# Allow imports from project root when run directly
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
-from data.questions import QUESTIONS_BY_ID, MODULE_1_QUESTIONS, MODULE_2_QUESTIONS
+# Allow imports from project root when run directly; as an imported module
+# the app's root is already on sys.path
+if __name__ == "__main__":
+    _ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if _ROOT not in sys.path:
+        sys.path.insert(0, _ROOT)
+
+from data.questions import MODULE_1_QUESTIONS, MODULE_2_QUESTIONS
+
+
+_MODEL_MAP = {
+    "copilot_score": "Copilot",
+    "agent_score": "Agent",
+    "service_score": "AI-enabled Service",
+}
+_MODEL_NAMES = tuple(_MODEL_MAP.values())
+
+# Option value -> scores per question, built once at import so scoring is a
+# dict lookup per answer instead of a scan over the options. Keys are
+# interned so lookups with the app's (interned) literals hit on identity
+# even if the question bank is ever loaded from JSON. Module 1 scores are
+# (copilot, agent, service) tuples in _MODEL_MAP order.
+_M1_LOOKUP = {
+    sys.intern(q["id"]): {
+        sys.intern(opt["value"]): tuple(opt["scores"].get(dim, 0) for dim in _MODEL_MAP)
+        for opt in q["options"] or ()
+    }
+    for q in MODULE_1_QUESTIONS
+}
+_M2_LOOKUP = {
+    sys.intern(q["id"]): {
+        sys.intern(opt["value"]): (opt["scores"]["x_score"], opt["scores"]["y_score"])
+        for opt in q["options"] or ()
+    }
+    for q in MODULE_2_QUESTIONS
+}
 
+# Indexed by (x >= 0) << 1 | (y > 0)
+_QUADRANTS = ("Danger Zone", "Efficiency Machine", "Promise Zone", "Revenue Engine")
 
 # ---------------------------------------------------------------------------
 # Module 1 - Business Model Classifier
@@ -23,30 +61,38 @@ def classify_business_model(answers):
     Returns:
         (model_name, confidence) where confidence is a percentage (0-100).
     """
-    totals = {"copilot_score": 0, "agent_score": 0, "service_score": 0}
-
-    for q in MODULE_1_QUESTIONS:
-        selected = answers.get(q["id"])
-        if selected is None or q["options"] is None:
+    # Integer sums don't depend on answer order, so any order shares an entry
+    return _classify_cached(frozenset(answers.items()))
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_cached(answer_items):
+    # Fixed slots as three locals: cheaper than indexing a [0, 0, 0] list
+    copilot = agent = service = 0
+
+    # Walk the answers given rather than every question. Completed surveys
+    # almost always hit, so try/except beats .get() + None checks; unknown
+    # ids and values are skipped.
+    for q_id, value in answer_items:
+        try:
+            c, a, s = _M1_LOOKUP[q_id][value]
+        except KeyError:
             continue
-        for opt in q["options"]:
-            if opt["value"] == selected:
-                for dim, val in opt["scores"].items():
-                    totals[dim] = totals.get(dim, 0) + val
-                break
-
-    model_map = {
-        "copilot_score": "Copilot",
-        "agent_score": "Agent",
-        "service_score": "AI-enabled Service",
-    }
-
-    top_dim = max(totals, key=totals.get)
-    top_score = totals[top_dim]
-    total = sum(totals.values())
+        copilot += c
+        agent += a
+        service += s
+
+    # Ties go to the earlier model, as max() over the dimensions would
+    if copilot >= agent and copilot >= service:
+        top, top_score = 0, copilot
+    elif agent >= service:
+        top, top_score = 1, agent
+    else:
+        top, top_score = 2, service
+    total = copilot + agent + service
     confidence = round((top_score / total) * 100, 1) if total > 0 else 0.0
 
-    return model_map[top_dim], confidence
+    return _MODEL_NAMES[top], confidence
 
 
 # ---------------------------------------------------------------------------
@@ -64,34 +110,33 @@ def calculate_value_position(answers):
         x: -1 to 1 (cost savings to revenue uplift)
         y: -1 to 1 (soft ROI to hard ROI)
     """
-    x_scores = []
-    y_scores = []
+    # Sums run in question order below, so key order can't change the result
+    return _value_position_cached(frozenset(answers.items()))
+
+
+@functools.lru_cache(maxsize=256)
+def _value_position_cached(answer_items):
+    answers = dict(answer_items)
+    sum_x = sum_y = 0.0
+    answered = 0
 
-    for q in MODULE_2_QUESTIONS:
-        selected = answers.get(q["id"])
-        if selected is None or q["options"] is None:
+    for q_id, option_scores in _M2_LOOKUP.items():
+        try:
+            dx, dy = option_scores[answers[q_id]]
+        except KeyError:  # unanswered or unknown value
             continue
-        for opt in q["options"]:
-            if opt["value"] == selected:
-                x_scores.append(opt["scores"]["x_score"])
-                y_scores.append(opt["scores"]["y_score"])
-                break
-
-    x = sum(x_scores) / len(x_scores) if x_scores else 0.0
-    y = sum(y_scores) / len(y_scores) if y_scores else 0.0
-
-    # Clamp to [-1, 1]
-    x = max(-1.0, min(1.0, x))
-    y = max(-1.0, min(1.0, y))
-
-    if x >= 0 and y > 0:
-        quadrant = "Revenue Engine"
-    elif x < 0 and y > 0:
-        quadrant = "Efficiency Machine"
-    elif x >= 0 and y <= 0:
-        quadrant = "Promise Zone"
-    else:
-        quadrant = "Danger Zone"
+        sum_x += dx
+        sum_y += dy
+        answered += 1
+
+    x = sum_x / answered if answered else 0.0
+    y = sum_y / answered if answered else 0.0
+
+    # Clamp to [-1, 1] (conditional expressions, no min/max calls)
+    x = -1.0 if x < -1.0 else 1.0 if x > 1.0 else x
+    y = -1.0 if y < -1.0 else 1.0 if y > 1.0 else y
+
+    quadrant = _QUADRANTS[(x >= 0) << 1 | (y > 0)]
 
     return round(x, 3), round(y, 3), quadrant
 
@@ -100,133 +145,258 @@ def calculate_value_position(answers):
 # Module 3 - Pricing Formula Generator (4 variants)
 # ---------------------------------------------------------------------------
 
+# Deal size tiers: up to $5K -> 50 units/mo, $25K -> 200, $100K -> 500, else 1000
+_UNIT_TIER_CUTS = (5000, 25000, 100000)
+_UNIT_TIER_UNITS = (50, 200, 500, 1000)
+
+_SEATS = MappingProxyType({"smb": 5, "mid_market": 25, "enterprise": 100})
+
+
 def _get_monthly_units(deal_size):
     """Map deal size to estimated monthly units."""
-    if deal_size <= 5000:
-        return 50
-    elif deal_size <= 25000:
-        return 200
-    elif deal_size <= 100000:
-        return 500
-    else:
-        return 1000
+    # bisect_left keeps each cut inclusive (a $5,000 deal is still 50 units)
+    return _UNIT_TIER_UNITS[bisect_left(_UNIT_TIER_CUTS, deal_size)]
 
 
 def _get_seats(customer_segment):
     """Map customer segment to estimated seat count."""
-    return {"smb": 5, "mid_market": 25, "enterprise": 100}.get(customer_segment, 25)
-
-
-def _empty_result():
-    return {
-        "model_name": "",
-        "platform_fee_annual": 0,
-        "platform_fee_monthly": 0,
-        "included_units": 0,
-        "overage_rate": 0,
-        "effective_price_per_unit": 0,
-        "gross_margin": 0,
-        "explanation": "",
-    }
+    return _SEATS.get(customer_segment, 25)
 
 
-def _hybrid_formula(cost, price, margin, deal_size):
-    monthly_units = _get_monthly_units(deal_size)
-    fee_monthly = round(cost * monthly_units * 2, 2)
-    fee_annual = round(fee_monthly * 12, 2)
-    included = max(1, int(fee_annual / (price * 1.5)))
-    overage = round(price * 1.2, 2)
+def _no_explanation():
+    return ""
 
-    annual_cost = cost * included
-    gm = round((fee_annual - annual_cost) / fee_annual * 100, 1) if fee_annual > 0 else 0
-
-    return {
-        "model_name": "Hybrid (Base + Usage)",
-        "platform_fee_annual": fee_annual,
-        "platform_fee_monthly": fee_monthly,
-        "included_units": included,
-        "overage_rate": overage,
-        "effective_price_per_unit": round(price, 2),
-        "gross_margin": gm,
-        "explanation": (
-            f"Charge ${fee_monthly:,.0f}/mo platform fee covering "
-            f"{included:,} included units/yr. "
-            f"Additional units at ${overage:,.2f} each."
-        ),
-    }
 
+@dataclass(frozen=True, slots=True)
+class PricingResult:
+    """Result of generate_pricing_formula.
 
-def _outcome_formula(cost, price, margin, deal_size):
-    min_commit = round(deal_size * 0.7, 2)
-    estimated_outcomes = max(1, int(min_commit / price))
-    fee_monthly = round(min_commit / 12, 2)
-
-    return {
-        "model_name": "Outcome-based",
-        "platform_fee_annual": min_commit,
-        "platform_fee_monthly": fee_monthly,
-        "included_units": estimated_outcomes,
-        "overage_rate": round(price, 2),
-        "effective_price_per_unit": round(price, 2),
-        "gross_margin": round(margin, 1),
-        "explanation": (
-            f"${price:,.2f} per outcome with ${min_commit:,.0f}/yr minimum "
-            f"commitment (~{estimated_outcomes:,} outcomes). "
-            f"Same rate for additional outcomes."
-        ),
-    }
+    The explanation sentence is only formatted when first read (and then
+    memoized per variant), so callers that just show the numbers skip the
+    string formatting.
+    """
 
+    model_name: str
+    platform_fee_annual: float
+    platform_fee_monthly: float
+    included_units: int
+    overage_rate: float
+    effective_price_per_unit: float
+    gross_margin: float
+    _explain: object = field(default=_no_explanation, repr=False, compare=False)
+    _explain_args: tuple = field(default=(), repr=False, compare=False)
+
+    @property
+    def explanation(self):
+        return self._explain(*self._explain_args)
+
+    def to_dict(self):
+        """Plain dict form, e.g. for JSON export."""
+        return {
+            "model_name": self.model_name,
+            "platform_fee_annual": self.platform_fee_annual,
+            "platform_fee_monthly": self.platform_fee_monthly,
+            "included_units": self.included_units,
+            "overage_rate": self.overage_rate,
+            "effective_price_per_unit": self.effective_price_per_unit,
+            "gross_margin": self.gross_margin,
+            "explanation": self.explanation,
+        }
+
+
+# Shared result for invalid inputs; PricingResult is frozen, so handing out
+# the same instance every time is safe
+_EMPTY_RESULT = PricingResult("", 0, 0, 0, 0, 0, 0)
+
+
+# Each variant is split into a numeric core (plain float/int arithmetic, no
+# dicts or strings) and a wrapper that formats the result dict. The cores
+# are what a batch sweep over prices or deal sizes needs to call.
+#
+# Money is carried in integer cents inside the cores and only turned back
+# into dollars on return. Inputs are positive, so adding half a cent and
+# truncating rounds to the nearest cent.
+
+def _cents(dollars):
+    return int(dollars * 100 + 0.5)
+
+
+def _hybrid_core(cost, price, monthly_units):
+    fee_monthly_c = _cents(cost * monthly_units * 2)
+    fee_annual_c = fee_monthly_c * 12
+    fee_annual = fee_annual_c / 100
+    included = max(1, int(fee_annual / (price * 1.5)))
+    overage_c = _cents(price * 1.2)
 
-def _workflow_formula(cost, price, margin, deal_size):
-    monthly_tasks = _get_monthly_units(deal_size)  # reuse same mapping
-    fee_monthly = round(monthly_tasks * price, 2)
-    fee_annual = round(fee_monthly * 12, 2)
+    annual_cost = cost * included
+    gm = round((fee_annual - annual_cost) / fee_annual * 100, 1) if fee_annual_c > 0 else 0
+    return fee_monthly_c / 100, fee_annual, included, overage_c / 100, gm
+
+
+def _hybrid_formula(cost, price, margin, deal_size, segment):
+    fee_monthly, fee_annual, included, overage, gm = _hybrid_core(
+        cost, price, _get_monthly_units(deal_size)
+    )
+
+    return PricingResult(
+        model_name="Hybrid (Base + Usage)",
+        platform_fee_annual=fee_annual,
+        platform_fee_monthly=fee_monthly,
+        included_units=included,
+        overage_rate=overage,
+        effective_price_per_unit=_cents(price) / 100,
+        gross_margin=gm,
+        _explain=_hybrid_explanation,
+        _explain_args=(fee_monthly, included, overage),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _hybrid_explanation(fee_monthly, included, overage):
+    return (
+        f"Charge ${fee_monthly:,.0f}/mo platform fee covering "
+        f"{included:,} included units/yr. "
+        f"Additional units at ${overage:,.2f} each."
+    )
+
+
+def _outcome_core(price, deal_size):
+    min_commit_c = _cents(deal_size * 0.7)
+    min_commit = min_commit_c / 100
+    estimated_outcomes = max(1, int(min_commit / price))
+    fee_monthly_c = (min_commit_c + 6) // 12  # nearest cent, halves up
+    return min_commit, fee_monthly_c / 100, estimated_outcomes
+
+
+def _outcome_formula(cost, price, margin, deal_size, segment):
+    min_commit, fee_monthly, estimated_outcomes = _outcome_core(price, deal_size)
+    price_per_outcome = _cents(price) / 100  # same rate for overage and text
+
+    return PricingResult(
+        model_name="Outcome-based",
+        platform_fee_annual=min_commit,
+        platform_fee_monthly=fee_monthly,
+        included_units=estimated_outcomes,
+        overage_rate=price_per_outcome,
+        effective_price_per_unit=price_per_outcome,
+        gross_margin=round(margin, 1),
+        _explain=_outcome_explanation,
+        _explain_args=(price_per_outcome, min_commit, estimated_outcomes),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _outcome_explanation(price, min_commit, estimated_outcomes):
+    return (
+        f"${price:,.2f} per outcome with ${min_commit:,.0f}/yr minimum "
+        f"commitment (~{estimated_outcomes:,} outcomes). "
+        f"Same rate for additional outcomes."
+    )
+
+
+def _workflow_core(price, monthly_tasks):
+    fee_monthly_c = _cents(monthly_tasks * price)
     annual_tasks = monthly_tasks * 12
-    discounted = round(price * 0.85, 2)
-
-    return {
-        "model_name": "Workflow-based (Per Task)",
-        "platform_fee_annual": fee_annual,
-        "platform_fee_monthly": fee_monthly,
-        "included_units": annual_tasks,
-        "overage_rate": discounted,
-        "effective_price_per_unit": round(price, 2),
-        "gross_margin": round(margin, 1),
-        "explanation": (
-            f"${price:,.2f} per task \u00d7 {monthly_tasks:,} tasks/mo = "
-            f"${fee_monthly:,.0f}/mo. "
-            f"15% volume discount at 2\u00d7 volume (${discounted:,.2f}/task)."
-        ),
-    }
+    discounted_c = _cents(price * 0.85)
+    return fee_monthly_c / 100, fee_monthly_c * 12 / 100, annual_tasks, discounted_c / 100
 
 
-def _per_seat_formula(cost, price, margin, deal_size, segment):
-    seats = _get_seats(segment)
-    monthly_per_seat = round(deal_size / 12 / seats, 2)
-    fee_monthly = round(monthly_per_seat * seats, 2)
-    fee_annual = round(fee_monthly * 12, 2)
-    extra_seat = round(monthly_per_seat * 1.5, 2)
+def _workflow_formula(cost, price, margin, deal_size, segment):
+    monthly_tasks = _get_monthly_units(deal_size)  # reuse same mapping
+    fee_monthly, fee_annual, annual_tasks, discounted = _workflow_core(
+        price, monthly_tasks
+    )
+    price_per_task = _cents(price) / 100  # shown in the explanation too
+
+    return PricingResult(
+        model_name="Workflow-based (Per Task)",
+        platform_fee_annual=fee_annual,
+        platform_fee_monthly=fee_monthly,
+        included_units=annual_tasks,
+        overage_rate=discounted,
+        effective_price_per_unit=price_per_task,
+        gross_margin=round(margin, 1),
+        _explain=_workflow_explanation,
+        _explain_args=(price_per_task, monthly_tasks, fee_monthly, discounted),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _workflow_explanation(price, monthly_tasks, fee_monthly, discounted):
+    return (
+        f"${price:,.2f} per task \u00d7 {monthly_tasks:,} tasks/mo = "
+        f"${fee_monthly:,.0f}/mo. "
+        f"15% volume discount at 2\u00d7 volume (${discounted:,.2f}/task)."
+    )
+
+
+def _per_seat_core(cost, deal_size, seats, monthly_units):
+    per_seat_c = _cents(deal_size / (12 * seats))  # one division, one rounding
+    fee_monthly_c = per_seat_c * seats
+    extra_seat_c = (per_seat_c * 3 + 1) // 2  # x1.5, halves up
+    monthly_per_seat = per_seat_c / 100
 
     # Estimate cost per seat
-    monthly_units = _get_monthly_units(deal_size)
     units_per_seat = monthly_units / seats
     cost_per_seat = cost * units_per_seat
-    gm = round((monthly_per_seat - cost_per_seat) / monthly_per_seat * 100, 1) if monthly_per_seat > 0 else 0
-
-    return {
-        "model_name": "Per-seat + Feature Tiers",
-        "platform_fee_annual": fee_annual,
-        "platform_fee_monthly": fee_monthly,
-        "included_units": seats,
-        "overage_rate": extra_seat,
-        "effective_price_per_unit": monthly_per_seat,
-        "gross_margin": gm,
-        "explanation": (
-            f"${monthly_per_seat:,.0f}/seat/month \u00d7 {seats} seats = "
-            f"${fee_monthly:,.0f}/mo. "
-            f"Additional seats at ${extra_seat:,.0f}/mo each."
-        ),
-    }
+    gm = round((monthly_per_seat - cost_per_seat) / monthly_per_seat * 100, 1) if per_seat_c > 0 else 0
+    return (monthly_per_seat, fee_monthly_c / 100, fee_monthly_c * 12 / 100,
+            extra_seat_c / 100, gm)
+
+
+def _make_per_seat_formula(seats):
+    """Per-seat variant with the segment's seat count bound in."""
+
+    def per_seat_formula(cost, price, margin, deal_size):
+        monthly_per_seat, fee_monthly, fee_annual, extra_seat, gm = _per_seat_core(
+            cost, deal_size, seats, _get_monthly_units(deal_size)
+        )
+
+        return PricingResult(
+            model_name="Per-seat + Feature Tiers",
+            platform_fee_annual=fee_annual,
+            platform_fee_monthly=fee_monthly,
+            included_units=seats,
+            overage_rate=extra_seat,
+            effective_price_per_unit=monthly_per_seat,
+            gross_margin=gm,
+            _explain=_per_seat_explanation,
+            _explain_args=(monthly_per_seat, seats, fee_monthly, extra_seat),
+        )
+
+    return per_seat_formula
+
+
+# One specialization per segment, built at import; unknown segments fall
+# back to the mid-market seat count like _get_seats
+_PER_SEAT_BY_SEGMENT = MappingProxyType(
+    {segment: _make_per_seat_formula(seats) for segment, seats in _SEATS.items()}
+)
+_PER_SEAT_DEFAULT = _make_per_seat_formula(_get_seats(None))
+
+
+def _per_seat_formula(cost, price, margin, deal_size, segment):
+    formula = _PER_SEAT_BY_SEGMENT.get(segment, _PER_SEAT_DEFAULT)
+    return formula(cost, price, margin, deal_size)
+
+
+@functools.lru_cache(maxsize=1024)
+def _per_seat_explanation(monthly_per_seat, seats, fee_monthly, extra_seat):
+    return (
+        f"${monthly_per_seat:,.0f}/seat/month \u00d7 {seats} seats = "
+        f"${fee_monthly:,.0f}/mo. "
+        f"Additional seats at ${extra_seat:,.0f}/mo each."
+    )
+
+
+# formula_type -> variant; all share the (cost, price, margin, deal_size,
+# segment) signature, only per-seat uses the segment
+_FORMULA_DISPATCH = MappingProxyType({
+    "hybrid": _hybrid_formula,
+    "outcome": _outcome_formula,
+    "workflow": _workflow_formula,
+    "per_seat": _per_seat_formula,
+})
 
 
 def generate_pricing_formula(cost_per_unit, target_margin, deal_size,
@@ -241,29 +411,36 @@ def generate_pricing_formula(cost_per_unit, target_margin, deal_size,
         customer_segment: "smb", "mid_market", or "enterprise"
 
     Returns:
-        dict with model_name, platform_fee_annual, platform_fee_monthly,
-        included_units, overage_rate, effective_price_per_unit,
-        gross_margin, explanation.
+        PricingResult with model_name, platform_fee_annual,
+        platform_fee_monthly, included_units, overage_rate,
+        effective_price_per_unit, gross_margin, explanation.
     """
+    # Results are frozen, so the memoized instance can be handed out as-is
+    return _cached_formula(cost_per_unit, target_margin, deal_size,
+                           formula_type, customer_segment)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_formula(cost_per_unit, target_margin, deal_size,
+                    formula_type, customer_segment):
     if cost_per_unit <= 0 or target_margin >= 100:
-        return _empty_result()
+        return _EMPTY_RESULT
 
     price = cost_per_unit / (1 - target_margin / 100)
 
-    if formula_type == "per_seat":
-        return _per_seat_formula(cost_per_unit, price, target_margin, deal_size, customer_segment)
-    elif formula_type == "outcome":
-        return _outcome_formula(cost_per_unit, price, target_margin, deal_size)
-    elif formula_type == "workflow":
-        return _workflow_formula(cost_per_unit, price, target_margin, deal_size)
-    else:  # hybrid (default)
-        return _hybrid_formula(cost_per_unit, price, target_margin, deal_size)
+    formula = _FORMULA_DISPATCH.get(formula_type, _hybrid_formula)  # hybrid default
+    return formula(cost_per_unit, price, target_margin, deal_size, customer_segment)
 
 
 # ---------------------------------------------------------------------------
 # Module 4 - Health Check Scorer
 # ---------------------------------------------------------------------------
 
+# A percentage at or above cut i earns label i + 1
+_HEALTH_LABEL_CUTS = (50, 70, 85)
+_HEALTH_LABELS = ("Early Stage", "Developing", "Strong", "Advanced")
+
+
 def calculate_health_score(scores):
     """Calculate health check score from Module 4 answers.
 
@@ -274,30 +451,85 @@ def calculate_health_score(scores):
     Returns:
         (percentage, label, top_3_priority_ids)
     """
+    # Keyed in dict order: it breaks ties between equal scores
+    percentage, label, top_3 = _health_score_cached(tuple(scores.items()))
+    return percentage, label, list(top_3)
+
+
+@functools.lru_cache(maxsize=256)
+def _health_score_cached(score_items):
+    scores = dict(score_items)
     total = sum(scores.values())
+    # Scored over the questions actually answered, so this can't be a
+    # module-level constant
     max_possible = len(scores) * 5
-    percentage = round((total / max_possible) * 100, 1) if max_possible > 0 else 0
-
-    if percentage >= 85:
-        label = "Advanced"
-    elif percentage >= 70:
-        label = "Strong"
-    elif percentage >= 50:
-        label = "Developing"
+    # Percentage to one decimal in integer tenths (halves round up), so
+    # integer scores never go through float rounding
+    if max_possible > 0:
+        percentage = (total * 2000 + max_possible) // (2 * max_possible) / 10
     else:
-        label = "Early Stage"
+        percentage = 0
+
+    label = _HEALTH_LABELS[bisect_right(_HEALTH_LABEL_CUTS, percentage)]
 
-    # Top 3 priorities = questions with lowest scores
-    sorted_ids = sorted(scores, key=scores.get)
-    top_3 = sorted_ids[:3]
+    # Top 3 priorities = questions with lowest scores (ties keep question
+    # order). For a ten-question survey one stable C-level sort beats both
+    # heapq.nsmallest's bookkeeping and a NumPy round trip; large batches
+    # go through calculate_health_score_batch instead.
+    top_3 = sorted(scores, key=scores.get)[:3]
 
-    return percentage, label, top_3
+    return percentage, label, tuple(top_3)
+
+
+def clear_scoring_caches():
+    """Drop all memoized scoring results (e.g. between tests)."""
+    _classify_cached.cache_clear()
+    _value_position_cached.cache_clear()
+    _health_score_cached.cache_clear()
+    _cached_formula.cache_clear()
+
+
+# ---------------------------------------------------------------------------
+# Batch scoring - analytics over many saved responses
+# ---------------------------------------------------------------------------
+# The NumPy kernels live in utils._scoring_batch and load on first use, so
+# importing this module for single responses stays cheap.
+
+_BATCH_API = frozenset({
+    "encode_answers",
+    "classify_business_model_batch",
+    "calculate_value_position_batch",
+    "calculate_health_score_batch",
+    "score_all_modules_batch",
+    "generate_pricing_formula_batch",
+})
+
+
+def __getattr__(name):
+    if name in _BATCH_API:
+        from utils import _scoring_batch
+        return getattr(_scoring_batch, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
 if __name__ == "__main__":
+    import random
+
+    import pandas as pd
+
+    from utils._scoring_batch import (
+        encode_answers,
+        classify_business_model_batch,
+        calculate_value_position_batch,
+        calculate_health_score_batch,
+        score_all_modules_batch,
+        generate_pricing_formula_batch,
+        _round_builtin,
+    )
+
     print("Running scoring tests...\n")
 
     # --- classify_business_model ---
@@ -326,6 +558,18 @@ if __name__ == "__main__":
     assert model == "AI-enabled Service"
     print(f"  Service: {model} ({conf}%) - PASS")
 
+    # --- classify_business_model_batch ---
+    batch = [copilot_answers, agent_answers, service_answers, {}]
+    models, confs = classify_business_model_batch(encode_answers(batch, 1))
+    assert models[:3] == ["Copilot", "Agent", "AI-enabled Service"]
+    assert [classify_business_model(a)[1] for a in batch] == list(confs)
+    print(f"  Batch classify: {models} - PASS")
+
+    df = pd.DataFrame(batch)  # unanswered cells become NaN
+    assert classify_business_model_batch(df)[0] == models
+    assert (encode_answers(df, 1) == encode_answers(batch, 1)).all()
+    print("  Batch classify from DataFrame - PASS")
+
     # --- calculate_value_position ---
     x, y, quad = calculate_value_position({
         "m2_q1": "revenue", "m2_q2": "yes", "m2_q3": "lose_revenue",
@@ -348,48 +592,106 @@ if __name__ == "__main__":
     assert quad == "Danger Zone" and y < 0
     print(f"  Danger Zone: x={x}, y={y} - PASS")
 
+    x, y, quad = calculate_value_position({
+        "m2_q1": "new_capability", "m2_q2": "no", "m2_q3": "no_pain",
+        "m2_q4": "qualitative", "m2_q5": "no",
+    })
+    assert quad == "Promise Zone" and x > 0 and y < 0
+    print(f"  Promise Zone: x={x}, y={y} - PASS")
+
+    # Boundaries of the quadrant lookup: x = 0 counts as revenue side,
+    # y = 0 as soft ROI
+    assert calculate_value_position({})[2] == "Promise Zone"
+    x, y, quad = calculate_value_position({"m2_q2": "yes"})
+    assert (x, quad) == (0.0, "Revenue Engine")
+    print("  Quadrant boundaries - PASS")
+
+    # --- calculate_value_position_batch ---
+    batch = [
+        {"m2_q1": "revenue", "m2_q2": "yes", "m2_q3": "lose_revenue",
+         "m2_q4": "dashboard", "m2_q5": "no"},
+        {"m2_q1": "time_savings", "m2_q2": "no", "m2_q3": "no_pain",
+         "m2_q4": "qualitative", "m2_q5": "partial"},
+        {"m2_q1": "revenue"},
+        {},
+    ]
+    xs, ys, quads = calculate_value_position_batch(encode_answers(batch, 2))
+    assert [calculate_value_position(a) for a in batch] == list(zip(xs, ys, quads))
+    print(f"  Batch value position: {quads} - PASS")
+
     # --- generate_pricing_formula: HYBRID ---
     r = generate_pricing_formula(1.0, 65, 62500, "hybrid")
-    assert r["platform_fee_annual"] > 0
-    assert r["included_units"] >= 1
-    assert 0 < r["gross_margin"] < 100
-    print(f"  Hybrid: fee=${r['platform_fee_annual']:,.0f}/yr, "
-          f"{r['included_units']} units, margin={r['gross_margin']}% - PASS")
+    assert r.platform_fee_annual > 0
+    assert r.included_units >= 1
+    assert 0 < r.gross_margin < 100
+    print(f"  Hybrid: fee=${r.platform_fee_annual:,.0f}/yr, "
+          f"{r.included_units} units, margin={r.gross_margin}% - PASS")
 
     # Acceptance: $1 cost, 65% margin, ~$25K deal -> fee ~$4,800-$14,400/yr
     r2 = generate_pricing_formula(1.0, 65, 25000, "hybrid")
-    assert 2000 <= r2["platform_fee_annual"] <= 20000, \
-        f"Fee ${r2['platform_fee_annual']} outside expected range"
-    print(f"  Hybrid $25K deal: fee=${r2['platform_fee_annual']:,.0f}/yr - PASS")
+    assert 2000 <= r2.platform_fee_annual <= 20000, \
+        f"Fee ${r2.platform_fee_annual} outside expected range"
+    print(f"  Hybrid $25K deal: fee=${r2.platform_fee_annual:,.0f}/yr - PASS")
 
     # --- generate_pricing_formula: OUTCOME ---
     r = generate_pricing_formula(1.0, 65, 62500, "outcome")
-    assert r["model_name"] == "Outcome-based"
-    assert r["platform_fee_annual"] > 0
-    assert r["gross_margin"] == 65.0
-    print(f"  Outcome: commit=${r['platform_fee_annual']:,.0f}/yr, "
-          f"{r['included_units']} outcomes - PASS")
+    assert r.model_name == "Outcome-based"
+    assert r.platform_fee_annual > 0
+    assert r.gross_margin == 65.0
+    print(f"  Outcome: commit=${r.platform_fee_annual:,.0f}/yr, "
+          f"{r.included_units} outcomes - PASS")
+
+    # Explanation quotes the same rounded price as the metrics, including
+    # on half-cent ties ($0.125 rounds up to $0.13)
+    for cost in (0.05, 1.0, 7.05):
+        r = generate_pricing_formula(cost, 60, 62500, "outcome")
+        assert f"${r.effective_price_per_unit:,.2f} per outcome" in r.explanation, cost
+    print(f"  Outcome explanation price - PASS")
 
     # --- generate_pricing_formula: WORKFLOW ---
     r = generate_pricing_formula(1.0, 65, 15000, "workflow")
-    assert r["model_name"] == "Workflow-based (Per Task)"
-    assert r["overage_rate"] < r["effective_price_per_unit"]  # discount
-    print(f"  Workflow: ${r['effective_price_per_unit']:.2f}/task, "
-          f"discount=${r['overage_rate']:.2f} - PASS")
+    assert r.model_name == "Workflow-based (Per Task)"
+    assert r.overage_rate < r.effective_price_per_unit  # discount
+    print(f"  Workflow: ${r.effective_price_per_unit:.2f}/task, "
+          f"discount=${r.overage_rate:.2f} - PASS")
+
+    # Explanation quotes the same rounded unit price as the metrics,
+    # including on half-cent ties ($0.625 rounds up to $0.63)
+    for cost in (0.25, 1.0, 7.05):
+        r = generate_pricing_formula(cost, 60, 15000, "workflow")
+        assert f"${r.effective_price_per_unit:,.2f} per task" in r.explanation, cost
+    print(f"  Workflow explanation price - PASS")
 
     # --- generate_pricing_formula: PER_SEAT ---
     r = generate_pricing_formula(1.0, 65, 62500, "per_seat", "mid_market")
-    assert r["model_name"] == "Per-seat + Feature Tiers"
-    assert r["included_units"] == 25  # mid_market seats
-    assert r["gross_margin"] > 0
-    print(f"  Per-seat: ${r['effective_price_per_unit']:,.0f}/seat/mo, "
-          f"{r['included_units']} seats, margin={r['gross_margin']}% - PASS")
+    assert r.model_name == "Per-seat + Feature Tiers"
+    assert r.included_units == 25  # mid_market seats
+    assert r.gross_margin > 0
+    print(f"  Per-seat: ${r.effective_price_per_unit:,.0f}/seat/mo, "
+          f"{r.included_units} seats, margin={r.gross_margin}% - PASS")
+
+    # --- PricingResult ---
+    d = r.to_dict()
+    assert d["explanation"] == r.explanation and "25 seats" in r.explanation
+    assert generate_pricing_formula(1.0, 65, 62500, "per_seat", "mid_market") is r
+    print(f"  PricingResult.to_dict: {len(d)} fields - PASS")
 
     # --- Edge: zero cost ---
     r = generate_pricing_formula(0, 65, 15000, "hybrid")
-    assert r["platform_fee_annual"] == 0
+    assert r.platform_fee_annual == 0
+    assert generate_pricing_formula(1.0, 100, 15000, "outcome") is r
     print(f"  Zero cost edge case - PASS")
 
+    # --- generate_pricing_formula_batch ---
+    deals = [1000, 5000, 25000, 62500, 250000]
+    for formula_type in ("hybrid", "outcome", "workflow", "per_seat"):
+        sweep = generate_pricing_formula_batch(1.0, 65, deals, formula_type, "smb")
+        for i, deal in enumerate(deals):
+            d = generate_pricing_formula(1.0, 65, deal, formula_type, "smb").to_dict()
+            assert all(sweep[k][i] == v for k, v in d.items() if k != "explanation")
+    assert generate_pricing_formula_batch(0, 65, deals, "hybrid")["model_name"][0] == ""
+    print(f"  Batch pricing sweep: {len(deals)} deal sizes x 4 variants - PASS")
+
     # --- calculate_health_score ---
     pct, label, _ = calculate_health_score({f"m4_q{i}": 5 for i in range(1, 11)})
     assert pct == 100.0 and label == "Advanced"
@@ -408,6 +710,59 @@ if __name__ == "__main__":
     assert pri[0] == "m4_q4" and "m4_q2" in pri and "m4_q7" in pri
     print(f"  Mixed: {pct}% {label}, priorities={pri} - PASS")
 
+    # --- Memoized scoring ---
+    pri.append("m4_q1")  # callers get their own list
+    assert len(calculate_health_score(mixed)[2]) == 3
+    clear_scoring_caches()
+    assert calculate_health_score(mixed) == (pct, label, pri[:3])
+    print("  Scoring caches - PASS")
+
+    # --- calculate_health_score_batch ---
+    batch = [mixed, {f"m4_q{i}": 5 for i in range(1, 11)}, {"m4_q3": 2, "m4_q9": 4}, {}]
+    pcts, labels, pris = calculate_health_score_batch(encode_answers(batch, 4))
+    for scores, p, l, row in zip(batch, pcts, labels, pris):
+        assert calculate_health_score(scores) == (p, l, [q for q in row if q])
+    print(f"  Batch health: {labels} - PASS")
+
+    # --- score_all_modules_batch ---
+    table = score_all_modules_batch(
+        encode_answers([copilot_answers, {}], 1),
+        encode_answers([{"m2_q1": "revenue"}, {}], 2),
+        encode_answers([mixed, {}], 4),
+    )
+    assert table["business_model"][0] == "Copilot"
+    assert table["quadrant"] == ["Revenue Engine", "Promise Zone"]
+    assert table["priority_areas"][1] == ["", "", ""]
+    print(f"  Batch all modules: {len(table)} columns - PASS")
+
+    # Batch/scalar parity on random answer sets, skipped questions included:
+    # the batch scorers round with round(), so results match exactly
+    assert _round_builtin([0.15, 0.45, 0.15], 1).tolist() == [0.1, 0.5, 0.1]  # np.round: 0.2, 0.4
+    rng = random.Random(0)
+
+    def _random_answers(lookup):
+        return {
+            q_id: rng.choice(list(option_scores))
+            for q_id, option_scores in lookup.items()
+            if rng.random() < 0.8
+        }
+
+    m1 = [_random_answers(_M1_LOOKUP) for _ in range(2000)]
+    m2 = [_random_answers(_M2_LOOKUP) for _ in range(2000)]
+    m4 = [
+        {f"m4_q{i}": rng.randint(1, 5) for i in range(1, 11) if rng.random() < 0.8}
+        for _ in range(2000)
+    ]
+    models, confs = classify_business_model_batch(m1)
+    assert [classify_business_model(a) for a in m1] == list(zip(models, confs.tolist()))
+    xs, ys, quads = calculate_value_position_batch(m2)
+    assert [calculate_value_position(a) for a in m2] == list(zip(xs.tolist(), ys.tolist(), quads))
+    pcts, labels, pris = calculate_health_score_batch(m4)
+    assert [calculate_health_score(a) for a in m4] == [
+        (p, l, [q for q in row if q]) for p, l, row in zip(pcts.tolist(), labels, pris)
+    ]
+    print(f"  Batch parity: {len(m1)} random answer sets x 3 modules - PASS")
+
     # --- Recommendation lookup ---
     from data.recommendations import get_pricing_recommendation
 
@@ -419,6 +774,10 @@ if __name__ == "__main__":
     assert rec["model_name"] == "Outcome-based"
     print(f"  Agent+hard+mod -> {rec['model_name']} - PASS")
 
+    rec = get_pricing_recommendation("Agent", "Revenue Engine", "high")
+    assert rec["model_name"] == "Hybrid (Base + Outcome Credits)"
+    print(f"  Agent+hard+high -> {rec['model_name']} - PASS")
+
     rec = get_pricing_recommendation("Agent", "Promise Zone", "low")
     assert rec["model_name"] == "Workflow-based (Per Task)"
     print(f"  Agent+soft+low -> {rec['model_name']} - PASS")
@@ -431,12 +790,39 @@ if __name__ == "__main__":
     assert rec["model_name"] == "Workflow-based + SLA Tiers"
     print(f"  Service+soft+mod -> {rec['model_name']} - PASS")
 
+    # Unknown cost variance: Copilot/Agent use their soft-ROI pick,
+    # AI-enabled Service keeps its quadrant-based pick
+    unknown_variance = {
+        ("Copilot", True): "Hybrid (Base + Usage Tiers)",
+        ("Copilot", False): "Hybrid (Base + Usage Tiers)",
+        ("Agent", True): "Workflow-based (Per Task)",
+        ("Agent", False): "Workflow-based (Per Task)",
+        ("AI-enabled Service", True): "Outcome-based (Per Deliverable)",
+        ("AI-enabled Service", False): "Workflow-based + SLA Tiers",
+    }
+    for model in ("Copilot", "Agent", "AI-enabled Service"):
+        for quadrant in _QUADRANTS:
+            hard_roi = quadrant in ("Revenue Engine", "Efficiency Machine")
+            rec = get_pricing_recommendation(model, quadrant, "unknown")
+            assert rec["model_name"] == unknown_variance[(model, hard_roi)], (model, quadrant)
+    print("  Unknown cost variance fallbacks - PASS")
+
+    # --- Health check actions ---
+    from data.recommendations import HEALTH_CHECK_ACTIONS, get_health_action
+
+    assert len(HEALTH_CHECK_ACTIONS) == 10
+    assert get_health_action(4) == HEALTH_CHECK_ACTIONS["m4_q4"]
+    print(f"  Health check actions - PASS")
+
     # --- Comp table ---
-    from data.comp_table import get_comps_by_model
+    from data.comp_table import get_comps_by_model, get_comps_df
 
     assert len(get_comps_by_model("Copilot")) == 1
     assert len(get_comps_by_model("Agent")) == 4
     assert len(get_comps_by_model("AI-enabled Service")) == 4
+    df = get_comps_df("Agent")
+    assert list(df["Company"]) == [c["name"] for c in get_comps_by_model("Agent")]
+    assert get_comps_df("Unknown") is None
     print(f"  Comp table filters - PASS")
 
     print("\nAll tests passed.")